@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import git
 
-from gitingest.config import DEFAULT_TIMEOUT
+from gitingest.config import DEFAULT_TIMEOUT, MAX_CONCURRENT_CLONES
 from gitingest.utils.git_utils import (
     check_repo_exists,
     checkout_partial_clone,
     create_git_repo,
     ensure_git_installed,
     git_auth_context,
+    git_timeout_kwargs,
     is_github_host,
     resolve_commit,
 )
@@ -27,6 +32,10 @@ if TYPE_CHECKING:
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# The blocking git commands of a clone run in their own bounded pool, so slow repositories cannot starve the default
+# executor that also serves ingestion, digest writes and S3 calls
+_clone_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CLONES, thread_name_prefix="gitingest-clone")
+
 
 @async_timeout(DEFAULT_TIMEOUT)
 async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
@@ -51,6 +60,9 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
         If Git operations fail during the cloning process.
 
     """
+    # Git commands still running at this point are killed, in step with the timeout on this coroutine
+    deadline = time.monotonic() + DEFAULT_TIMEOUT
+
     # Extract and validate query parameters
     url: str = config.url
     local_path: str = config.local_path
@@ -76,63 +88,135 @@ async def clone_repo(config: CloneConfig, *, token: str | None = None) -> None:
     logger.debug("Creating local directory", extra={"parent_path": str(Path(local_path).parent)})
     await ensure_directory_exists_or_create(Path(local_path).parent)
 
-    logger.debug("Checking if repository exists", extra={"url": url})
-    if not await check_repo_exists(url, token=token):
+    # The existence check and the commit lookup are independent ``git ls-remote`` round-trips; run them concurrently
+    logger.debug("Checking if repository exists and resolving commit reference", extra={"url": url})
+    repo_exists, commit = await asyncio.gather(
+        check_repo_exists(url, token=token),
+        resolve_commit(config, token=token),
+        return_exceptions=True,
+    )
+    if repo_exists is not True:
         logger.error("Repository not found", extra={"url": url})
         msg = "Repository not found. Make sure it is public or that you have provided a valid token."
         raise ValueError(msg)
-
-    logger.debug("Resolving commit reference")
-    commit = await resolve_commit(config, token=token)
+    if isinstance(commit, BaseException):
+        raise commit
     logger.debug("Resolved commit", extra={"commit": commit})
 
-    # Clone the repository using GitPython with proper authentication
+    # Clone the repository using GitPython with proper authentication. The git commands are blocking network I/O, so
+    # they run in the clone pool; each one is killed once the clone's deadline passes, since the timeout on this
+    # coroutine only cancels the wait, not the worker thread
     logger.info("Executing git clone operation", extra={"url": "<redacted>", "local_path": local_path})
+    future = _clone_executor.submit(_clone_and_checkout, config, token, commit, deadline)
     try:
-        clone_kwargs = {
-            "single_branch": True,
-            "no_checkout": True,
-            "depth": 1,
-        }
-
-        with git_auth_context(url, token) as (git_cmd, auth_url):
-            if partial_clone:
-                # For partial clones, use git.Git() with filter and sparse options
-                cmd_args = ["--single-branch", "--no-checkout", "--depth=1"]
-                cmd_args.extend(["--filter=blob:none", "--sparse"])
-                cmd_args.extend([auth_url, local_path])
-                git_cmd.clone(*cmd_args)
-            elif token and is_github_host(url):
-                # For authenticated GitHub repos, use git_cmd with auth URL
-                cmd_args = ["--single-branch", "--no-checkout", "--depth=1", auth_url, local_path]
-                git_cmd.clone(*cmd_args)
-            else:
-                # For non-authenticated repos, use the standard GitPython method
-                git.Repo.clone_from(url, local_path, **clone_kwargs)
+        await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        # Remove whatever the worker wrote once its git command has been killed (or right away if it never started)
+        future.add_done_callback(lambda _: _remove_clone(local_path))
+        raise
+
+    logger.info("Git clone operation completed successfully", extra={"local_path": local_path})
+
 
+def _clone_and_checkout(config: CloneConfig, token: str | None, commit: str, deadline: float) -> None:
+    """Clone the repository, check out ``commit`` and update submodules, removing the clone if any step fails.
+
+    Parameters
+    ----------
+    config : CloneConfig
+        The configuration for cloning the repository.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+    commit : str
+        The commit SHA to checkout.
+    deadline : float
+        The ``time.monotonic()`` value after which running git commands are killed.
+
+    """
+    partial_clone = config.subpath != "/"
+    try:
+        _git_clone(config.url, config.local_path, token, partial_clone=partial_clone, deadline=deadline)
         logger.info("Git clone completed successfully")
-    except git.GitCommandError as exc:
-        msg = f"Git clone failed: {exc}"
-        raise RuntimeError(msg) from exc
 
-    # Checkout the subpath if it is a partial clone
-    if partial_clone:
-        logger.info("Setting up partial clone for subpath", extra={"subpath": config.subpath})
-        await checkout_partial_clone(config, token=token)
-        logger.debug("Partial clone setup completed")
+        # Checkout the subpath if it is a partial clone
+        if partial_clone:
+            logger.info("Setting up partial clone for subpath", extra={"subpath": config.subpath})
+            checkout_partial_clone(config, token=token, timeout=_time_left(deadline))
+            logger.debug("Partial clone setup completed")
 
-    # Perform post-clone operations
-    await _perform_post_clone_operations(config, local_path, url, token, commit)
+        # Perform post-clone operations
+        _perform_post_clone_operations(config, config.local_path, config.url, token, commit, deadline)
+    except BaseException:
+        _remove_clone(config.local_path)
+        raise
 
-    logger.info("Git clone operation completed successfully", extra={"local_path": local_path})
+
+def _time_left(deadline: float) -> float:
+    """Return the seconds left until ``deadline``.
+
+    Raises
+    ------
+    RuntimeError
+        If the deadline has already passed.
+
+    """
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        msg = f"Git clone timed out after {DEFAULT_TIMEOUT} seconds"
+        raise RuntimeError(msg)
+    return remaining
+
+
+def _remove_clone(local_path: str) -> None:
+    """Remove a failed or abandoned clone at ``local_path``, if anything was written."""
+    shutil.rmtree(local_path, ignore_errors=True)
+
+
+def _git_clone(url: str, local_path: str, token: str | None, *, partial_clone: bool, deadline: float) -> None:
+    """Run ``git clone`` for a shallow, single-branch checkout-less clone of ``url`` into ``local_path``.
+
+    Parameters
+    ----------
+    url : str
+        The repository URL.
+    local_path : str
+        The local path to clone the repository into.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+    partial_clone : bool
+        Whether to clone without blobs and with sparse-checkout enabled, for ingesting a subpath.
+    deadline : float
+        The ``time.monotonic()`` value after which the clone is killed.
+
+    Raises
+    ------
+    RuntimeError
+        If the clone fails or times out.
+
+    """
+    cmd_args = ["--single-branch", "--no-checkout", "--depth=1"]
+    if partial_clone:
+        # For partial clones, clone without blobs and with sparse-checkout enabled
+        cmd_args.extend(["--filter=blob:none", "--sparse"])
+
+    with git_auth_context(url, token) as (git_cmd, auth_url):
+        # Only GitHub hosts receive the token; ``Repo.clone_from`` cannot be killed on timeout, so always use git_cmd
+        clone_url = auth_url if partial_clone or (token and is_github_host(url)) else url
+        git.Git.check_unsafe_protocols(clone_url)
+        try:
+            git_cmd.clone(*cmd_args, "--", clone_url, local_path, **git_timeout_kwargs(_time_left(deadline)))
+        except git.GitCommandError as exc:
+            msg = f"Git clone failed: {exc}"
+            raise RuntimeError(msg) from exc
 
 
-async def _perform_post_clone_operations(
+def _perform_post_clone_operations(
     config: CloneConfig,
     local_path: str,
     url: str,
     token: str | None,
     commit: str,
+    deadline: float,
 ) -> None:
     """Perform post-clone operations like fetching, checkout, and submodule updates.
 
@@ -148,11 +232,13 @@ async def _perform_post_clone_operations(
         GitHub personal access token (PAT) for accessing private repositories.
     commit : str
         The commit SHA to checkout.
+    deadline : float
+        The ``time.monotonic()`` value after which running git commands are killed.
 
     Raises
     ------
     RuntimeError
-        If any Git operation fails.
+        If any Git operation fails or the deadline passes.
 
     """
     try:
@@ -160,16 +246,22 @@ async def _perform_post_clone_operations(
 
         # Ensure the commit is locally available
         logger.debug("Fetching specific commit", extra={"commit": commit})
-        repo.git.fetch("--depth=1", "origin", commit)
+        repo.git.fetch("--depth=1", "origin", commit, **git_timeout_kwargs(_time_left(deadline)))
 
         # Write the work-tree at that commit
         logger.info("Checking out commit", extra={"commit": commit})
-        repo.git.checkout(commit)
+        repo.git.checkout(commit, **git_timeout_kwargs(_time_left(deadline)))
 
         # Update submodules
         if config.include_submodules:
             logger.info("Updating submodules")
-            repo.git.submodule("update", "--init", "--recursive", "--depth=1")
+            repo.git.submodule(
+                "update",
+                "--init",
+                "--recursive",
+                "--depth=1",
+                **git_timeout_kwargs(_time_left(deadline)),
+            )
             logger.debug("Submodules updated successfully")
     except git.GitCommandError as exc:
         msg = f"Git operation failed: {exc}"
@@ -8,6 +8,7 @@ MAX_DIRECTORY_DEPTH = 20  # Maximum depth of directory traversal
 MAX_FILES = 10_000  # Maximum number of files to process
 MAX_TOTAL_SIZE_BYTES = 500 * 1024 * 1024  # Maximum size of output file (500 MB)
 DEFAULT_TIMEOUT = 60  # seconds
+MAX_CONCURRENT_CLONES = 8  # Maximum number of clones running at the same time in one process
 
 OUTPUT_FILE_NAME = "digest.txt"
 
@@ -8,11 +8,19 @@ from typing import TYPE_CHECKING
 from gitingest.config import MAX_DIRECTORY_DEPTH, MAX_FILES, MAX_TOTAL_SIZE_BYTES
 from gitingest.output_formatter import format_node
 from gitingest.schemas import FileSystemNode, FileSystemNodeType, FileSystemStats
-from gitingest.utils.ingestion_utils import _should_exclude, _should_include
+from gitingest.utils.ingestion_utils import (
+    _compile_ignore_spec,
+    _compile_include_spec,
+    _should_exclude,
+    _should_include,
+)
 from gitingest.utils.logging_config import get_logger
 
 if TYPE_CHECKING:
+    from pathspec import PathSpec
+
     from gitingest.schemas import IngestionQuery
+    from gitingest.utils.ingestion_utils import _IncludeSpec
 
 # Initialize logger for this module
 logger = get_logger(__name__)
@@ -104,7 +112,14 @@ def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
 
     stats = FileSystemStats()
 
-    _process_node(node=root_node, query=query, stats=stats)
+    # Compile the patterns once for the whole walk instead of looking them up for every path
+    _process_node(
+        node=root_node,
+        query=query,
+        stats=stats,
+        ignore_spec=_compile_ignore_spec(query.ignore_patterns) if query.ignore_patterns else None,
+        include_spec=_compile_include_spec(query.include_patterns) if query.include_patterns else None,
+    )
 
     logger.info(
         "Directory processing completed",
@@ -120,7 +135,14 @@ def ingest_query(query: IngestionQuery) -> tuple[str, str, str]:
     return format_node(root_node, query=query)
 
 
-def _process_node(node: FileSystemNode, query: IngestionQuery, stats: FileSystemStats) -> None:
+def _process_node(
+    node: FileSystemNode,
+    query: IngestionQuery,
+    stats: FileSystemStats,
+    *,
+    ignore_spec: PathSpec | None = None,
+    include_spec: _IncludeSpec | None = None,
+) -> None:
     """Process a file or directory item within a directory.
 
     This function handles each file or directory item, checking if it should be included or excluded based on the
@@ -134,16 +156,20 @@ def _process_node(node: FileSystemNode, query: IngestionQuery, stats: FileSystem
         The parsed query object containing information about the repository and query parameters.
     stats : FileSystemStats
         Statistics tracking object for the total file count and size.
+    ignore_spec : PathSpec | None
+        The compiled ``query.ignore_patterns``, or ``None`` if there are none.
+    include_spec : _IncludeSpec | None
+        The compiled ``query.include_patterns``, or ``None`` if there are none.
 
     """
     if limit_exceeded(stats, depth=node.depth):
         return
 
     for sub_path in node.path.iterdir():
-        if query.ignore_patterns and _should_exclude(sub_path, query.local_path, query.ignore_patterns):
+        if ignore_spec is not None and _should_exclude(sub_path, query.local_path, ignore_spec):
             continue
 
-        if query.include_patterns and not _should_include(sub_path, query.local_path, query.include_patterns):
+        if include_spec is not None and not _should_include(sub_path, query.local_path, include_spec):
             continue
 
         if sub_path.is_symlink():
@@ -169,7 +195,13 @@ def _process_node(node: FileSystemNode, query: IngestionQuery, stats: FileSystem
                 depth=node.depth + 1,
             )
 
-            _process_node(node=child_directory_node, query=query, stats=stats)
+            _process_node(
+                node=child_directory_node,
+                query=query,
+                stats=stats,
+                ignore_spec=ignore_spec,
+                include_spec=include_spec,
+            )
 
             if not child_directory_node.children:
                 continue
@@ -50,6 +50,8 @@ class IngestionQuery(BaseModel):  # pylint: disable=too-many-instance-attributes
         Whether to include all Git submodules within the repository. (default: ``False``)
     s3_url : str | None
         The S3 URL where the digest is stored if S3 is enabled.
+    s3_file_path : str | None
+        The S3 key of the digest if S3 is enabled, once computed.
 
     """
 
@@ -70,6 +72,7 @@ class IngestionQuery(BaseModel):  # pylint: disable=too-many-instance-attributes
     include_patterns: set[str] | None = None
     include_submodules: bool = Field(default=False)
     s3_url: str | None = None
+    s3_file_path: str | None = None
 
     def extract_clone_config(self) -> CloneConfig:
         """Extract the relevant fields for the CloneConfig object.
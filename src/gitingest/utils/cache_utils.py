@@ -0,0 +1,178 @@
+"""Caching helpers for the Gitingest package."""
+
+from __future__ import annotations
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+from gitingest.utils.compat_typing import ParamSpec
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+T = TypeVar("T")
+P = ParamSpec("P")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping whose entries expire ``ttl`` seconds after they were stored.
+
+    At most ``maxsize`` entries are kept; the least recently used one is evicted first. If ``weigh`` is given, entries
+    are also evicted until their total weight is at most ``maxweight``, and a single value heavier than that is not
+    stored at all.
+
+    Parameters
+    ----------
+    ttl : float
+        The number of seconds an entry stays valid.
+    maxsize : int
+        The maximum number of entries (default: 1024).
+    maxweight : int | None
+        The maximum total weight of the entries (default: no limit).
+    weigh : Callable[[V], int] | None
+        Function returning the weight of a value, e.g. its size in bytes. Required if ``maxweight`` is set.
+
+    Raises
+    ------
+    ValueError
+        If ``maxweight`` is set without a ``weigh`` function.
+
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 1024,
+        *,
+        maxweight: int | None = None,
+        weigh: Callable[[V], int] | None = None,
+    ) -> None:
+        if maxweight is not None and weigh is None:
+            msg = "maxweight requires a weigh function"
+            raise ValueError(msg)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.maxweight = maxweight
+        self._weigh = weigh
+        self._weight = 0
+        self._entries: OrderedDict[K, tuple[float, V, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    @property
+    def weight(self) -> int:
+        """Return the total weight of the stored entries (always 0 without a ``weigh`` function)."""
+        return self._weight
+
+    def get(self, key: K) -> V | None:
+        """Return the value stored for ``key``, or ``None`` if it is missing or expired.
+
+        Parameters
+        ----------
+        key : K
+            The key to look up.
+
+        Returns
+        -------
+        V | None
+            The stored value, or ``None`` on a miss.
+
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self.pop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` for ``key``, evicting the least recently used entries if the cache is full.
+
+        Parameters
+        ----------
+        key : K
+            The key to store the value under.
+        value : V
+            The value to store.
+
+        """
+        self.pop(key)
+        weight = self._weigh(value) if self._weigh else 0
+        if self.maxweight is not None and weight > self.maxweight:
+            return
+        self._entries[key] = (time.monotonic(), value, weight)
+        self._weight += weight
+        while len(self._entries) > self.maxsize or (self.maxweight is not None and self._weight > self.maxweight):
+            _, (_, _, evicted_weight) = self._entries.popitem(last=False)
+            self._weight -= evicted_weight
+
+    def pop(self, key: K) -> None:
+        """Remove the entry for ``key``, if any.
+
+        Parameters
+        ----------
+        key : K
+            The key to remove.
+
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._weight -= entry[2]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self._weight = 0
+
+
+def async_ttl_cache(
+    ttl: float,
+    maxsize: int = 1024,
+    key: Callable[..., Hashable] | None = None,
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Async TTL cache decorator.
+
+    This decorator memoizes the result of an asynchronous function for ``ttl`` seconds. At most ``maxsize`` results
+    are kept; the least recently used one is evicted first. Exceptions and ``None`` results are never cached. The
+    wrapped function exposes a ``cache_clear()`` method to drop all cached results.
+
+    Parameters
+    ----------
+    ttl : float
+        The number of seconds a result stays valid.
+    maxsize : int
+        The maximum number of cached results (default: 1024).
+    key : Callable[..., Hashable] | None
+        Function computing the cache key from the call arguments. If ``None``, the arguments themselves are used.
+
+    Returns
+    -------
+    Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]
+        A decorator that, when applied to an async function, caches its results for ``ttl`` seconds.
+
+    """
+
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        cache: TTLCache[Hashable, T] = TTLCache(ttl=ttl, maxsize=maxsize)
+
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            result = await func(*args, **kwargs)
+            cache.set(cache_key, result)
+            return result
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
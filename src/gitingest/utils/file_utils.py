@@ -15,6 +15,7 @@ except locale.Error:
     locale.setlocale(locale.LC_ALL, "C")
 
 _CHUNK_SIZE = 1024  # bytes
+_IS_WINDOWS = platform.system() == "Windows"
 
 
 def _get_preferred_encodings() -> list[str]:
@@ -28,7 +29,7 @@ def _get_preferred_encodings() -> list[str]:
 
     """
     encodings = [locale.getpreferredencoding(), "utf-8", "utf-16", "utf-16le", "utf-8-sig", "latin"]
-    if platform.system() == "Windows":
+    if _IS_WINDOWS:
         encodings += ["cp1252", "iso-8859-1"]
     return list(dict.fromkeys(encodings))
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import hashlib
 import re
 import sys
 from contextlib import contextmanager
@@ -13,6 +14,7 @@ from urllib.parse import urlparse, urlunparse
 
 import git
 
+from gitingest.utils.cache_utils import async_ttl_cache
 from gitingest.utils.compat_func import removesuffix
 from gitingest.utils.exceptions import InvalidGitHubTokenError
 from gitingest.utils.logging_config import get_logger
@@ -27,6 +29,10 @@ logger = get_logger(__name__)
 #   - ghp_ / gho_ / ghu_ / ghs_ / ghr_  → 36 alphanumerics
 #   - github_pat_                       → 22 alphanumerics + "_" + 59 alphanumerics
 _GITHUB_PAT_PATTERN: Final[str] = r"^(?:gh[pousr]_[A-Za-z0-9]{36}|github_pat_[A-Za-z0-9]{22}_[A-Za-z0-9]{59})$"
+_GITHUB_PAT_RE: Final[re.Pattern[str]] = re.compile(_GITHUB_PAT_PATTERN)
+
+# How long a resolved ref is reused; bursts of requests for the same repository share one ``git ls-remote``
+_LS_REMOTE_CACHE_TTL: Final[int] = 30
 
 
 def is_github_host(url: str) -> bool:
@@ -392,19 +398,42 @@ def validate_github_token(token: str) -> None:
         If the token format is invalid.
 
     """
-    if not re.fullmatch(_GITHUB_PAT_PATTERN, token):
+    if not _GITHUB_PAT_RE.fullmatch(token):
         raise InvalidGitHubTokenError
 
 
-async def checkout_partial_clone(config: CloneConfig, token: str | None) -> None:
+def token_fingerprint(token: str | None) -> str | None:
+    """Return a stable, non-reversible identifier for ``token``, suitable as a cache key.
+
+    Parameters
+    ----------
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+
+    Returns
+    -------
+    str | None
+        The SHA-256 hex digest of the token, or ``None`` if no token is given.
+
+    """
+    if not token:
+        return None
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def checkout_partial_clone(config: CloneConfig, token: str | None, *, timeout: float | None = None) -> None:
     """Configure sparse-checkout for a partially cloned repository.
 
+    This runs a blocking ``git`` command; call it from a worker thread.
+
     Parameters
     ----------
     config : CloneConfig
         The configuration for cloning the repository, including subpath and blob flag.
     token : str | None
         GitHub personal access token (PAT) for accessing private repositories.
+    timeout : float | None
+        Seconds after which the ``git`` command is killed (default: no limit).
 
     Raises
     ------
@@ -419,12 +448,33 @@ async def checkout_partial_clone(config: CloneConfig, token: str | None) -> None
 
     try:
         repo = create_git_repo(config.local_path, config.url, token)
-        repo.git.sparse_checkout("set", subpath)
+        repo.git.sparse_checkout("set", subpath, **git_timeout_kwargs(timeout))
     except git.GitCommandError as exc:
         msg = f"Failed to configure sparse-checkout: {exc}"
         raise RuntimeError(msg) from exc
 
 
+def git_timeout_kwargs(timeout: float | None) -> dict[str, float]:
+    """Return the GitPython keyword arguments that kill a ``git`` command after ``timeout`` seconds.
+
+    GitPython does not support ``kill_after_timeout`` on Windows; there the command runs to completion.
+
+    Parameters
+    ----------
+    timeout : float | None
+        Seconds after which the command is killed, or ``None`` for no limit.
+
+    Returns
+    -------
+    dict[str, float]
+        ``{"kill_after_timeout": timeout}``, or an empty dict if no limit applies.
+
+    """
+    if timeout is None or sys.platform == "win32":
+        return {}
+    return {"kill_after_timeout": timeout}
+
+
 async def resolve_commit(config: CloneConfig, token: str | None) -> str:
     """Resolve the commit to use for the clone.
 
@@ -452,6 +502,10 @@ async def resolve_commit(config: CloneConfig, token: str | None) -> str:
     return commit
 
 
+@async_ttl_cache(
+    ttl=_LS_REMOTE_CACHE_TTL,
+    key=lambda url, pattern, token=None: (url, pattern, token_fingerprint(token)),
+)
 async def _resolve_ref_to_sha(url: str, pattern: str, token: str | None = None) -> str:
     """Return the commit SHA that <kind>/<ref> points to in <url>.
 
@@ -478,10 +532,11 @@ async def _resolve_ref_to_sha(url: str, pattern: str, token: str | None = None)
         If the ref does not exist in the remote repository.
 
     """
+    loop = asyncio.get_running_loop()
     try:
-        # Execute ls-remote command with proper authentication
+        # Execute ls-remote command with proper authentication, off the event loop so callers can probe concurrently
         with git_auth_context(url, token) as (git_cmd, auth_url):
-            output = git_cmd.ls_remote(auth_url, pattern)
+            output = await loop.run_in_executor(None, git_cmd.ls_remote, auth_url, pattern)
         lines = output.splitlines()
 
         sha = _pick_commit_sha(lines)
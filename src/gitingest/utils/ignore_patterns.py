@@ -4,168 +4,170 @@ from __future__ import annotations
 
 from pathlib import Path
 
-DEFAULT_IGNORE_PATTERNS: set[str] = {
-    # Python
-    "*.pyc",
-    "*.pyo",
-    "*.pyd",
-    "__pycache__",
-    ".pytest_cache",
-    ".coverage",
-    ".tox",
-    ".nox",
-    ".mypy_cache",
-    ".ruff_cache",
-    ".hypothesis",
-    "poetry.lock",
-    "Pipfile.lock",
-    # JavaScript/FileSystemNode
-    "node_modules",
-    "bower_components",
-    "package-lock.json",
-    "yarn.lock",
-    ".npm",
-    ".yarn",
-    ".pnpm-store",
-    "bun.lock",
-    "bun.lockb",
-    # Java
-    "*.class",
-    "*.jar",
-    "*.war",
-    "*.ear",
-    "*.nar",
-    ".gradle/",
-    "build/",
-    ".settings/",
-    ".classpath",
-    "gradle-app.setting",
-    "*.gradle",
-    # IDEs and editors / Java
-    ".project",
-    # C/C++
-    "*.o",
-    "*.obj",
-    "*.dll",
-    "*.dylib",
-    "*.exe",
-    "*.lib",
-    "*.out",
-    "*.a",
-    "*.pdb",
-    # Binary
-    "*.bin",
-    # Swift/Xcode
-    ".build/",
-    "*.xcodeproj/",
-    "*.xcworkspace/",
-    "*.pbxuser",
-    "*.mode1v3",
-    "*.mode2v3",
-    "*.perspectivev3",
-    "*.xcuserstate",
-    "xcuserdata/",
-    ".swiftpm/",
-    # Ruby
-    "*.gem",
-    ".bundle/",
-    "vendor/bundle",
-    "Gemfile.lock",
-    ".ruby-version",
-    ".ruby-gemset",
-    ".rvmrc",
-    # Rust
-    "Cargo.lock",
-    "**/*.rs.bk",
-    # Java / Rust
-    "target/",
-    # Go
-    "pkg/",
-    # .NET/C#
-    "obj/",
-    "*.suo",
-    "*.user",
-    "*.userosscache",
-    "*.sln.docstates",
-    "*.nupkg",
-    # Go / .NET / C#
-    "bin/",
-    # Version control
-    ".git",
-    ".svn",
-    ".hg",
-    ".gitignore",
-    ".gitattributes",
-    ".gitmodules",
-    # Images and media
-    "*.svg",
-    "*.png",
-    "*.jpg",
-    "*.jpeg",
-    "*.gif",
-    "*.ico",
-    "*.pdf",
-    "*.mov",
-    "*.mp4",
-    "*.mp3",
-    "*.wav",
-    # Virtual environments
-    "venv",
-    ".venv",
-    "env",
-    ".env",
-    "virtualenv",
-    # IDEs and editors
-    ".idea",
-    ".vscode",
-    ".vs",
-    "*.swo",
-    "*.swn",
-    ".settings",
-    "*.sublime-*",
-    # Temporary and cache files
-    "*.log",
-    "*.bak",
-    "*.swp",
-    "*.tmp",
-    "*.temp",
-    ".cache",
-    ".sass-cache",
-    ".eslintcache",
-    ".DS_Store",
-    "Thumbs.db",
-    "desktop.ini",
-    # Build directories and artifacts
-    "build",
-    "dist",
-    "target",
-    "out",
-    "*.egg-info",
-    "*.egg",
-    "*.whl",
-    "*.so",
-    # Documentation
-    "site-packages",
-    ".docusaurus",
-    ".next",
-    ".nuxt",
-    # Database
-    "*.db",
-    "*.sqlite",
-    "*.sqlite3",
-    # Other common patterns
-    ## Minified files
-    "*.min.js",
-    "*.min.css",
-    ## Source maps
-    "*.map",
-    ## Terraform
-    "*.tfstate*",
-    ## Dependencies in various languages
-    "vendor/",
-    # Gitingest
-    "digest.txt",
-}
+DEFAULT_IGNORE_PATTERNS: frozenset[str] = frozenset(
+    {
+        # Python
+        "*.pyc",
+        "*.pyo",
+        "*.pyd",
+        "__pycache__",
+        ".pytest_cache",
+        ".coverage",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".ruff_cache",
+        ".hypothesis",
+        "poetry.lock",
+        "Pipfile.lock",
+        # JavaScript/FileSystemNode
+        "node_modules",
+        "bower_components",
+        "package-lock.json",
+        "yarn.lock",
+        ".npm",
+        ".yarn",
+        ".pnpm-store",
+        "bun.lock",
+        "bun.lockb",
+        # Java
+        "*.class",
+        "*.jar",
+        "*.war",
+        "*.ear",
+        "*.nar",
+        ".gradle/",
+        "build/",
+        ".settings/",
+        ".classpath",
+        "gradle-app.setting",
+        "*.gradle",
+        # IDEs and editors / Java
+        ".project",
+        # C/C++
+        "*.o",
+        "*.obj",
+        "*.dll",
+        "*.dylib",
+        "*.exe",
+        "*.lib",
+        "*.out",
+        "*.a",
+        "*.pdb",
+        # Binary
+        "*.bin",
+        # Swift/Xcode
+        ".build/",
+        "*.xcodeproj/",
+        "*.xcworkspace/",
+        "*.pbxuser",
+        "*.mode1v3",
+        "*.mode2v3",
+        "*.perspectivev3",
+        "*.xcuserstate",
+        "xcuserdata/",
+        ".swiftpm/",
+        # Ruby
+        "*.gem",
+        ".bundle/",
+        "vendor/bundle",
+        "Gemfile.lock",
+        ".ruby-version",
+        ".ruby-gemset",
+        ".rvmrc",
+        # Rust
+        "Cargo.lock",
+        "**/*.rs.bk",
+        # Java / Rust
+        "target/",
+        # Go
+        "pkg/",
+        # .NET/C#
+        "obj/",
+        "*.suo",
+        "*.user",
+        "*.userosscache",
+        "*.sln.docstates",
+        "*.nupkg",
+        # Go / .NET / C#
+        "bin/",
+        # Version control
+        ".git",
+        ".svn",
+        ".hg",
+        ".gitignore",
+        ".gitattributes",
+        ".gitmodules",
+        # Images and media
+        "*.svg",
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.ico",
+        "*.pdf",
+        "*.mov",
+        "*.mp4",
+        "*.mp3",
+        "*.wav",
+        # Virtual environments
+        "venv",
+        ".venv",
+        "env",
+        ".env",
+        "virtualenv",
+        # IDEs and editors
+        ".idea",
+        ".vscode",
+        ".vs",
+        "*.swo",
+        "*.swn",
+        ".settings",
+        "*.sublime-*",
+        # Temporary and cache files
+        "*.log",
+        "*.bak",
+        "*.swp",
+        "*.tmp",
+        "*.temp",
+        ".cache",
+        ".sass-cache",
+        ".eslintcache",
+        ".DS_Store",
+        "Thumbs.db",
+        "desktop.ini",
+        # Build directories and artifacts
+        "build",
+        "dist",
+        "target",
+        "out",
+        "*.egg-info",
+        "*.egg",
+        "*.whl",
+        "*.so",
+        # Documentation
+        "site-packages",
+        ".docusaurus",
+        ".next",
+        ".nuxt",
+        # Database
+        "*.db",
+        "*.sqlite",
+        "*.sqlite3",
+        # Other common patterns
+        ## Minified files
+        "*.min.js",
+        "*.min.css",
+        ## Source maps
+        "*.map",
+        ## Terraform
+        "*.tfstate*",
+        ## Dependencies in various languages
+        "vendor/",
+        # Gitingest
+        "digest.txt",
+    },
+)
 
 
 def load_ignore_patterns(root: Path, filename: str) -> set[str]:
@@ -13,8 +13,8 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-def _should_include(path: Path, base_path: Path, include_patterns: set[str]) -> bool:
-    """Return ``True`` if ``path`` matches ``include_patterns`` or leads to one.
+def _should_include(path: Path, base_path: Path, include_spec: _IncludeSpec) -> bool:
+    """Return ``True`` if ``path`` matches the include patterns or leads to one.
 
     Parameters
     ----------
@@ -24,8 +24,8 @@ def _should_include(path: Path, base_path: Path, include_patterns: set[str]) ->
     base_path : Path
         The base directory from which the relative path is calculated.
 
-    include_patterns : set[str]
-        A set of patterns to check against the relative path.
+    include_spec : _IncludeSpec
+        The compiled include patterns, as returned by ``_compile_include_spec``.
 
     Returns
     -------
@@ -37,8 +37,7 @@ def _should_include(path: Path, base_path: Path, include_patterns: set[str]) ->
     if rel_path is None:  # outside repo → do *not* include
         return False
 
-    patterns_key = tuple(sorted(include_patterns))
-    spec, parsed_patterns = _get_include_spec(patterns_key)
+    spec = include_spec.spec
 
     rel_str = rel_path.as_posix()
     if rel_str == ".":
@@ -51,17 +50,28 @@ def _should_include(path: Path, base_path: Path, include_patterns: set[str]) ->
         return True
 
     dir_parts = _relative_parts(rel_path)
-    return any(_pattern_could_match_directory(pattern, dir_parts) for pattern in parsed_patterns)
+    return any(_pattern_could_match_directory(pattern, dir_parts) for pattern in include_spec.patterns)
+
+
+def _compile_include_spec(include_patterns: set[str]) -> _IncludeSpec:
+    """Return the compiled ``include_patterns``; call it once per ingest and pass the result to ``_should_include``."""
+    return _get_include_spec(tuple(sorted(include_patterns)))
 
 
 @lru_cache(maxsize=None)
-def _get_include_spec(
-    patterns_key: tuple[str, ...],
-) -> tuple[PathSpec, tuple[_ParsedIncludePattern, ...]]:
+def _get_include_spec(patterns_key: tuple[str, ...]) -> _IncludeSpec:
     """Return the ``PathSpec`` and parsed pattern parts for ``include_patterns``."""
     spec = PathSpec.from_lines("gitwildmatch", patterns_key)
     parsed = tuple(_parse_include_pattern(pattern) for pattern in patterns_key)
-    return spec, parsed
+    return _IncludeSpec(spec=spec, patterns=parsed)
+
+
+@dataclass(frozen=True)
+class _IncludeSpec:
+    """Represent compiled include patterns: a ``PathSpec`` for files and parsed patterns for directories."""
+
+    spec: PathSpec
+    patterns: tuple[_ParsedIncludePattern, ...]
 
 
 @dataclass(frozen=True)
@@ -131,8 +141,8 @@ def _pattern_could_match_directory(pattern: _ParsedIncludePattern, dir_parts: tu
     return _matches(0, 0)
 
 
-def _should_exclude(path: Path, base_path: Path, ignore_patterns: set[str]) -> bool:
-    """Return ``True`` if ``path`` matches any of ``ignore_patterns``.
+def _should_exclude(path: Path, base_path: Path, ignore_spec: PathSpec) -> bool:
+    """Return ``True`` if ``path`` matches any of the ignore patterns.
 
     Parameters
     ----------
@@ -140,8 +150,8 @@ def _should_exclude(path: Path, base_path: Path, ignore_patterns: set[str]) -> b
         The absolute path of the file or directory to check.
     base_path : Path
         The base directory from which the relative path is calculated.
-    ignore_patterns : set[str]
-        A set of patterns to check against the relative path.
+    ignore_spec : PathSpec
+        The compiled ignore patterns, as returned by ``_compile_ignore_spec``.
 
     Returns
     -------
@@ -153,8 +163,18 @@ def _should_exclude(path: Path, base_path: Path, ignore_patterns: set[str]) -> b
     if rel_path is None:  # outside repo → already "excluded"
         return True
 
-    spec = PathSpec.from_lines("gitwildmatch", ignore_patterns)
-    return spec.match_file(str(rel_path))
+    return ignore_spec.match_file(str(rel_path))
+
+
+def _compile_ignore_spec(ignore_patterns: set[str]) -> PathSpec:
+    """Return the compiled ``ignore_patterns``; call it once per ingest and pass the result to ``_should_exclude``."""
+    return _get_ignore_spec(frozenset(ignore_patterns))
+
+
+@lru_cache(maxsize=256)
+def _get_ignore_spec(patterns_key: frozenset[str]) -> PathSpec:
+    """Return the ``PathSpec`` for ``ignore_patterns``, compiled once per distinct pattern set."""
+    return PathSpec.from_lines("gitwildmatch", patterns_key)
 
 
 def _relative_or_none(path: Path, base: Path) -> Path | None:
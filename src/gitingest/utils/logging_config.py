@@ -148,7 +148,8 @@ def configure_logging() -> None:
             enqueue=True,  # Async logging for better performance
             diagnose=False,  # Don't include variable values in exceptions (security)
             backtrace=True,  # Include full traceback
-            serialize=True,  # Ensure proper serialization
+            # No serialize=True: json_sink builds its own JSON line from ``message.record`` and writes it in one call,
+            # so letting loguru serialize every record as well would only encode each log line twice
         )
     else:
         # Human-readable format for development
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from itertools import chain
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from gitingest.utils.exceptions import InvalidNotebookError
 from gitingest.utils.logging_config import get_logger
@@ -15,6 +15,14 @@ if TYPE_CHECKING:
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+# Map each notebook output type to a function extracting its lines of text
+_OUTPUT_HANDLERS: dict[str, Callable[[dict[str, Any]], list[str]]] = {
+    "stream": lambda output: output["text"],
+    "execute_result": lambda output: output["data"]["text/plain"],
+    "display_data": lambda output: output["data"]["text/plain"],
+    "error": lambda output: [f"Error: {output['ename']}: {output['evalue']}"],
+}
+
 
 def process_notebook(file: Path, *, include_output: bool = True) -> str:
     """Process a Jupyter notebook file and return an executable Python script as a string.
@@ -59,7 +67,7 @@ def process_notebook(file: Path, *, include_output: bool = True) -> str:
                 "Multiple worksheets detected. Combining all worksheets into a single script.",
             )
 
-        cells = list(chain.from_iterable(ws["cells"] for ws in worksheets))
+        cells = chain.from_iterable(ws["cells"] for ws in worksheets)
 
     else:
         cells = notebook["cells"]
@@ -98,31 +106,21 @@ def _process_cell(cell: dict[str, Any], *, include_output: bool) -> str | None:
     cell_type = cell["cell_type"]
 
     # Validate cell type and handle unexpected types
-    if cell_type not in ("markdown", "code", "raw"):
+    handler = _CELL_HANDLERS.get(cell_type)
+    if handler is None:
         msg = f"Unknown cell type: {cell_type}"
         raise ValueError(msg)
 
-    cell_str = "".join(cell["source"])
+    # Skip empty cells before joining; ``source`` is either a string or a list of lines
+    source = cell["source"]
+    if not source:
+        return None
 
-    # Skip empty cells
+    cell_str = source if isinstance(source, str) else "".join(source)
     if not cell_str:
         return None
 
-    # Convert Markdown and raw cells to multi-line comments
-    if cell_type in ("markdown", "raw"):
-        return f'"""\n{cell_str}\n"""'
-
-    # Add cell output as comments
-    outputs = cell.get("outputs")
-    if include_output and outputs:
-        # Include cell outputs as comments
-        raw_lines: list[str] = []
-        for output in outputs:
-            raw_lines += _extract_output(output)
-
-        cell_str += "\n# Output:\n#   " + "\n#   ".join(raw_lines)
-
-    return cell_str
+    return handler(cell_str, cell.get("outputs") if include_output else None)
 
 
 def _extract_output(output: dict[str, Any]) -> list[str]:
@@ -146,14 +144,34 @@ def _extract_output(output: dict[str, Any]) -> list[str]:
     """
     output_type = output["output_type"]
 
-    if output_type == "stream":
-        return output["text"]
+    handler = _OUTPUT_HANDLERS.get(output_type)
+    if handler is None:
+        msg = f"Unknown output type: {output_type}"
+        raise ValueError(msg)
+
+    return handler(output)
+
+
+def _format_text_cell(cell_str: str, _outputs: list[dict[str, Any]] | None) -> str:
+    """Convert a Markdown or raw cell to a multi-line comment."""
+    return f'"""\n{cell_str}\n"""'
+
+
+def _format_code_cell(cell_str: str, outputs: list[dict[str, Any]] | None) -> str:
+    """Return a code cell with its outputs, if any, appended as comments."""
+    if not outputs:
+        return cell_str
+
+    raw_lines: list[str] = []
+    for output in outputs:
+        raw_lines += _extract_output(output)
 
-    if output_type in ("execute_result", "display_data"):
-        return output["data"]["text/plain"]
+    return cell_str + "\n# Output:\n#   " + "\n#   ".join(raw_lines)
 
-    if output_type == "error":
-        return [f"Error: {output['ename']}: {output['evalue']}"]
 
-    msg = f"Unknown output type: {output_type}"
-    raise ValueError(msg)
+# Map each notebook cell type to a function rendering its (non-empty) source
+_CELL_HANDLERS: dict[str, Callable[[str, list[dict[str, Any]] | None], str]] = {
+    "markdown": _format_text_cell,
+    "raw": _format_text_cell,
+    "code": _format_code_cell,
+}
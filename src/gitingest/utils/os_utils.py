@@ -1,11 +1,16 @@
 """Utility functions for working with the operating system."""
 
+import asyncio
+from functools import partial
 from pathlib import Path
 
 
 async def ensure_directory_exists_or_create(path: Path) -> None:
     """Ensure the directory exists, creating it if necessary.
 
+    The common case of an existing directory is answered with a single ``stat``; otherwise the directory is created
+    in the default executor so the blocking ``mkdir`` calls do not stall the event loop.
+
     Parameters
     ----------
     path : Path
@@ -17,8 +22,12 @@ async def ensure_directory_exists_or_create(path: Path) -> None:
         If the directory cannot be created.
 
     """
+    if path.is_dir():
+        return
+
+    loop = asyncio.get_running_loop()
     try:
-        path.mkdir(parents=True, exist_ok=True)
+        await loop.run_in_executor(None, partial(path.mkdir, parents=True, exist_ok=True))
     except OSError as exc:
         msg = f"Failed to create directory {path}: {exc}"
         raise OSError(msg) from exc
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-import string
+import asyncio
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
-from urllib.parse import ParseResult, unquote, urlparse
+from urllib.parse import SplitResult, unquote, urlsplit
 
+from gitingest.utils.cache_utils import async_ttl_cache
 from gitingest.utils.compat_typing import StrEnum
-from gitingest.utils.git_utils import _resolve_ref_to_sha, check_repo_exists
+from gitingest.utils.git_utils import _resolve_ref_to_sha, check_repo_exists, token_fingerprint
 from gitingest.utils.logging_config import get_logger
 
 if TYPE_CHECKING:
@@ -16,7 +19,10 @@ if TYPE_CHECKING:
 # Initialize logger for this module
 logger = get_logger(__name__)
 
-HEX_DIGITS: set[str] = set(string.hexdigits)
+_COMMIT_HASH_RE = re.compile(r"[0-9a-fA-F]{40}")
+
+_REPO_EXISTS_CACHE_TTL = 300  # seconds
+_QUALIFIED_SOURCE_CACHE_SIZE = 2048
 
 KNOWN_GIT_HOSTS: list[str] = [
     "github.com",
@@ -27,6 +33,18 @@ KNOWN_GIT_HOSTS: list[str] = [
     "gist.github.com",
 ]
 
+# ``(domain, whether to send the GitHub token)`` pairs; only GitHub hosts ever receive the token
+_KNOWN_GIT_HOSTS_TOKEN_POLICY: tuple[tuple[str, bool], ...] = tuple(
+    (domain, domain.startswith("github.")) for domain in KNOWN_GIT_HOSTS
+)
+
+_GIT_HOST_PREFIXES = ("git.", "gitlab.", "github.")
+
+# Matches a host from ``KNOWN_GIT_HOSTS`` or one accepted by ``_looks_like_git_host``
+_GIT_HOST_RE = re.compile(
+    "|".join([*map(re.escape, KNOWN_GIT_HOSTS), *(f"{re.escape(prefix)}.*" for prefix in _GIT_HOST_PREFIXES)]),
+)
+
 
 class PathKind(StrEnum):
     """Path kind enum."""
@@ -62,8 +80,8 @@ async def _fallback_to_root(query: IngestionQuery, token: str | None, warn_msg:
     return query
 
 
-async def _normalise_source(raw: str, token: str | None) -> ParseResult:
-    """Return a fully-qualified ParseResult or raise.
+async def _normalise_source(raw: str, token: str | None) -> SplitResult:
+    """Return a fully-qualified SplitResult or raise.
 
     Parameters
     ----------
@@ -74,12 +92,43 @@ async def _normalise_source(raw: str, token: str | None) -> ParseResult:
 
     Returns
     -------
-    ParseResult
+    SplitResult
         The parsed URL.
 
     """
-    raw = unquote(raw)
-    parsed = urlparse(raw)
+    # Only pay for unquoting when the input actually contains percent-escapes
+    if "%" in raw:
+        raw = unquote(raw)
+
+    parsed = _parse_qualified_source(raw)
+    if parsed is not None:
+        return parsed
+
+    # "user/repo" slug; only the host probes are cached, by ``_check_repo_exists_cached``
+    host = await _try_domains_for_user_and_repo(*_get_user_and_repo_from_path(raw), token=token)
+
+    return urlsplit(f"https://{host}/{raw}")
+
+
+@lru_cache(maxsize=_QUALIFIED_SOURCE_CACHE_SIZE)
+def _parse_qualified_source(raw: str) -> SplitResult | None:
+    """Parse and validate ``raw`` if it has a scheme or an explicit host, or return ``None`` for a ``user/repo`` slug.
+
+    The result depends on ``raw`` alone and needs no network access, so it is cached without expiry. Validation errors
+    are not cached. ``SplitResult`` is immutable, so sharing it is safe.
+
+    Parameters
+    ----------
+    raw : str
+        The unquoted URL to parse.
+
+    Returns
+    -------
+    SplitResult | None
+        The parsed URL, or ``None`` if ``raw`` is a slug whose host still has to be found.
+
+    """
+    parsed = urlsplit(raw)
 
     if parsed.scheme:
         _validate_url_scheme(parsed.scheme)
@@ -90,12 +139,9 @@ async def _normalise_source(raw: str, token: str | None) -> ParseResult:
     host = raw.split("/", 1)[0].lower()
     if "." in host:
         _validate_host(host)
-        return urlparse(f"https://{raw}")
-
-    # "user/repo" slug
-    host = await _try_domains_for_user_and_repo(*_get_user_and_repo_from_path(raw), token=token)
+        return urlsplit(f"https://{raw}")
 
-    return urlparse(f"https://{host}/{raw}")
+    return None
 
 
 async def _try_domains_for_user_and_repo(user_name: str, repo_name: str, token: str | None = None) -> str:
@@ -121,15 +167,52 @@ async def _try_domains_for_user_and_repo(user_name: str, repo_name: str, token:
         If no valid repository host is found for the given ``user_name`` and ``repo_name``.
 
     """
-    for domain in KNOWN_GIT_HOSTS:
-        candidate = f"https://{domain}/{user_name}/{repo_name}"
-        if await check_repo_exists(candidate, token=token if domain.startswith("github.") else None):
-            return domain
+    # Probe all hosts concurrently, but honour the order of ``KNOWN_GIT_HOSTS`` when several of them match
+    probes = [
+        asyncio.create_task(
+            _check_repo_exists_cached(
+                f"https://{domain}/{user_name}/{repo_name}",
+                token=token if wants_token else None,
+            ),
+        )
+        for domain, wants_token in _KNOWN_GIT_HOSTS_TOKEN_POLICY
+    ]
+    try:
+        for domain, probe in zip(KNOWN_GIT_HOSTS, probes):
+            if await probe:
+                return domain
+    finally:
+        for probe in probes:
+            probe.cancel()
 
     msg = f"Could not find a valid repository host for '{user_name}/{repo_name}'."
     raise ValueError(msg)
 
 
+@async_ttl_cache(ttl=_REPO_EXISTS_CACHE_TTL, key=lambda url, token=None: (url, token_fingerprint(token)))
+async def _check_repo_exists_cached(url: str, token: str | None = None) -> bool | None:
+    """Return whether the repository exists, reusing positive results from the last ``_REPO_EXISTS_CACHE_TTL`` seconds.
+
+    ``check_repo_exists`` reports a network error the same way as a missing repository, so a negative result may be
+    transient. It is returned as ``None``, which ``async_ttl_cache`` never caches; caching it would resolve a slug to
+    a lower-priority host, i.e. a different repository, until the entry expires.
+
+    Parameters
+    ----------
+    url : str
+        URL of the Git repository to check.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+
+    Returns
+    -------
+    bool | None
+        ``True`` if the repository exists, ``None`` otherwise.
+
+    """
+    return True if await check_repo_exists(url, token=token) else None
+
+
 def _is_valid_git_commit_hash(commit: str) -> bool:
     """Validate if the provided string is a valid Git commit hash.
 
@@ -147,8 +230,7 @@ def _is_valid_git_commit_hash(commit: str) -> bool:
         ``True`` if the string is a valid 40-character Git commit hash, otherwise ``False``.
 
     """
-    sha_hex_length = 40
-    return len(commit) == sha_hex_length and all(c in HEX_DIGITS for c in commit)
+    return _COMMIT_HASH_RE.fullmatch(commit) is not None
 
 
 def _validate_host(host: str) -> None:
@@ -156,7 +238,8 @@ def _validate_host(host: str) -> None:
 
     The host is accepted if it is either present in the hard-coded ``KNOWN_GIT_HOSTS`` list or if it satisfies the
     simple heuristics in ``_looks_like_git_host``, which try to recognise common self-hosted Git services (e.g. GitLab
-    instances on sub-domains such as 'gitlab.example.com' or 'git.example.com').
+    instances on sub-domains such as 'gitlab.example.com' or 'git.example.com'). Both checks are folded into the
+    single precompiled ``_GIT_HOST_RE``.
 
     Parameters
     ----------
@@ -170,7 +253,7 @@ def _validate_host(host: str) -> None:
 
     """
     host = host.lower()
-    if host not in KNOWN_GIT_HOSTS and not _looks_like_git_host(host):
+    if not _GIT_HOST_RE.fullmatch(host):
         msg = f"Unknown domain '{host}' in URL"
         raise ValueError(msg)
 
@@ -193,7 +276,7 @@ def _looks_like_git_host(host: str) -> bool:
 
     """
     host = host.lower()
-    return host.startswith(("git.", "gitlab.", "github."))
+    return host.startswith(_GIT_HOST_PREFIXES)
 
 
 def _validate_url_scheme(scheme: str) -> None:
@@ -1,5 +1,6 @@
 """Server module entry point for running with python -m server."""
 
+import importlib.util
 import os
 
 import uvicorn
@@ -14,12 +15,26 @@ if __name__ == "__main__":
     host = os.getenv("HOST", "0.0.0.0")  # noqa: S104
     port = int(os.getenv("PORT", "8000"))
     reload = os.getenv("RELOAD", "false").lower() == "true"
+    # Reloading only works with a single worker process
+    workers = 1 if reload else int(os.getenv("WORKERS", "1"))
+    # uvloop is not available on Windows; fall back to the standard asyncio event loop there
+    loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "h11"
+
+    if loop != "uvloop" or http != "httptools":
+        logger.warning(
+            "uvloop/httptools not available, falling back to slower pure-Python implementations",
+            extra={"loop": loop, "http": http},
+        )
 
     logger.info(
         "Starting Gitingest server",
         extra={
             "host": host,
             "port": port,
+            "workers": workers,
+            "loop": loop,
+            "http": http,
         },
     )
 
@@ -28,5 +43,8 @@ if __name__ == "__main__":
         host=host,
         port=port,
         reload=reload,
+        workers=workers,
+        loop=loop,
+        http=http,
         log_config=None,  # Disable uvicorn's default logging config
     )
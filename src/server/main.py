@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-import threading
+from functools import lru_cache
 from pathlib import Path
 
 import sentry_sdk
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from slowapi.errors import RateLimitExceeded
 from starlette.middleware.trustedhost import TrustedHostMiddleware
@@ -18,8 +21,8 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 from gitingest.utils.logging_config import get_logger
 from server.metrics_server import start_metrics_server
 from server.routers import dynamic, index, ingest
-from server.server_config import get_version_info, templates
-from server.server_utils import limiter, rate_limit_exception_handler
+from server.server_config import MetricsConfig, SentryConfig, get_version_info, templates
+from server.server_utils import etag_matches, limiter, rate_limit_exception_handler
 
 # Load environment variables from .env file
 load_dotenv()
@@ -27,33 +30,22 @@ load_dotenv()
 # Initialize logger for this module
 logger = get_logger(__name__)
 
-# Initialize Sentry SDK if enabled
-if os.getenv("GITINGEST_SENTRY_ENABLED") is not None:
-    sentry_dsn = os.getenv("GITINGEST_SENTRY_DSN")
-
-    # Only initialize Sentry if DSN is provided
-    if sentry_dsn:
-        # Configure Sentry options from environment variables
-        traces_sample_rate = float(os.getenv("GITINGEST_SENTRY_TRACES_SAMPLE_RATE", "1.0"))
-        profile_session_sample_rate = float(os.getenv("GITINGEST_SENTRY_PROFILE_SESSION_SAMPLE_RATE", "1.0"))
-        profile_lifecycle_raw = os.getenv("GITINGEST_SENTRY_PROFILE_LIFECYCLE", "trace")
-        profile_lifecycle = profile_lifecycle_raw if profile_lifecycle_raw in ("manual", "trace") else "trace"
-        send_default_pii = os.getenv("GITINGEST_SENTRY_SEND_DEFAULT_PII", "true").lower() == "true"
-        sentry_environment = os.getenv("GITINGEST_SENTRY_ENVIRONMENT", "")
-
-        sentry_sdk.init(
-            dsn=sentry_dsn,
-            # Add data like request headers and IP for users
-            send_default_pii=send_default_pii,
-            # Set traces_sample_rate to capture transactions for tracing
-            traces_sample_rate=traces_sample_rate,
-            # Set profile_session_sample_rate to profile sessions
-            profile_session_sample_rate=profile_session_sample_rate,
-            # Set profile_lifecycle to automatically run the profiler
-            profile_lifecycle=profile_lifecycle,
-            # Set environment name
-            environment=sentry_environment,
-        )
+# Initialize Sentry SDK if enabled (and a DSN is provided)
+sentry_config = SentryConfig.from_env()
+if sentry_config:
+    sentry_sdk.init(
+        dsn=sentry_config.dsn,
+        # Add data like request headers and IP for users
+        send_default_pii=sentry_config.send_default_pii,
+        # Set traces_sample_rate to capture transactions for tracing
+        traces_sample_rate=sentry_config.traces_sample_rate,
+        # Set profile_session_sample_rate to profile sessions
+        profile_session_sample_rate=sentry_config.profile_session_sample_rate,
+        # Set profile_lifecycle to automatically run the profiler
+        profile_lifecycle=sentry_config.profile_lifecycle,
+        # Set environment name
+        environment=sentry_config.environment,
+    )
 
 # Initialize the FastAPI application
 app = FastAPI(docs_url=None, redoc_url=None)
@@ -62,16 +54,10 @@ app.state.limiter = limiter
 # Register the custom exception handler for rate limits
 app.add_exception_handler(RateLimitExceeded, rate_limit_exception_handler)
 
-# Start metrics server in a separate thread if enabled
-if os.getenv("GITINGEST_METRICS_ENABLED") is not None:
-    metrics_host = os.getenv("GITINGEST_METRICS_HOST", "127.0.0.1")
-    metrics_port = int(os.getenv("GITINGEST_METRICS_PORT", "9090"))
-    metrics_thread = threading.Thread(
-        target=start_metrics_server,
-        args=(metrics_host, metrics_port),
-        daemon=True,
-    )
-    metrics_thread.start()
+# Start metrics server (in its own daemon thread) if enabled
+metrics_config = MetricsConfig.from_env()
+if metrics_config:
+    start_metrics_server(metrics_config.host, metrics_config.port)
 
 
 # Mount static files dynamically to serve CSS, JS, and other static assets
@@ -79,6 +65,55 @@ static_dir = Path(__file__).parent.parent / "static"
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 
+def _load_static_text(name: str) -> tuple[bytes, str]:
+    """Read a static text file once and compute its ETag.
+
+    Parameters
+    ----------
+    name : str
+        The file name, relative to the static directory.
+
+    Returns
+    -------
+    tuple[bytes, str]
+        The file content and its quoted ETag.
+
+    """
+    content = (static_dir / name).read_bytes()
+    return content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def _static_text_response(request: Request, static_text: tuple[bytes, str]) -> Response:
+    """Serve an in-memory static text file, answering ``304 Not Modified`` when the client's copy is current.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming HTTP request.
+    static_text : tuple[bytes, str]
+        The file content and ETag, as returned by ``_load_static_text``.
+
+    Returns
+    -------
+    Response
+        The file content as ``text/plain``, or an empty ``304`` response if ``If-None-Match`` matches the ETag.
+
+    """
+    content, etag = static_text
+    headers = {"Cache-Control": "public, max-age=86400", "ETag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/plain", headers=headers)
+
+
+# These files never change at runtime, so read them once instead of opening them on every request
+_ROBOTS_TXT = _load_static_text("robots.txt")
+_LLMS_TXT = _load_static_text("llms.txt")
+
+
+# Resolve the template once instead of going through the Jinja loader on every request
+_SWAGGER_UI_TEMPLATE = templates.get_template("swagger_ui.jinja")
+
 # Fetch allowed hosts from the environment or use the default values
 allowed_hosts = os.getenv("ALLOWED_HOSTS")
 if allowed_hosts:
@@ -91,17 +126,23 @@ else:
 # Add middleware to enforce allowed hosts
 app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
 
+# Compress larger responses, such as multi-MB digests returned by the ingest API
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+_HEALTH_CHECK_BODY = b'{"status":"healthy"}'
+
 
-@app.get("/health")
-async def health_check() -> dict[str, str]:
+@app.get("/health", response_model=None)
+async def health_check() -> Response:
     """Health check endpoint to verify that the server is running.
 
     **Returns**
 
-    - **dict[str, str]**: A JSON object with a "status" key indicating the server's health status.
+    - **Response**: A JSON object with a "status" key indicating the server's health status.
 
     """
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_CHECK_BODY, media_type="application/json")
 
 
 @app.head("/", include_in_schema=False)
@@ -121,35 +162,43 @@ async def head_root() -> HTMLResponse:
 
 
 @app.get("/robots.txt", include_in_schema=False)
-async def robots() -> FileResponse:
+async def robots(request: Request) -> Response:
     """Serve the robots.txt file to guide search engine crawlers.
 
-    **This endpoint serves the ``robots.txt`` file located in the static directory**
+    **This endpoint serves the ``robots.txt`` file located in the static directory, cached in memory**
     to provide instructions to search engine crawlers about which parts of the site
     they should or should not index.
 
+    **Parameters**
+
+    - **request** (`Request`): The incoming HTTP request
+
     **Returns**
 
-    - **FileResponse**: The ``robots.txt`` file located in the static directory
+    - **Response**: The ``robots.txt`` content, or ``304 Not Modified`` if the client's cached copy is current
 
     """
-    return FileResponse("static/robots.txt")
+    return _static_text_response(request, _ROBOTS_TXT)
 
 
 @app.get("/llms.txt")
-async def llm_txt() -> FileResponse:
+async def llm_txt(request: Request) -> Response:
     """Serve the llm.txt file to provide information about the site to LLMs.
 
-    **This endpoint serves the ``llms.txt`` file located in the static directory**
+    **This endpoint serves the ``llms.txt`` file located in the static directory, cached in memory**
     to provide information about the site to Large Language Models (LLMs)
     and other AI systems that may be crawling the site.
 
+    **Parameters**
+
+    - **request** (`Request`): The incoming HTTP request
+
     **Returns**
 
-    - **FileResponse**: The ``llms.txt`` file located in the static directory
+    - **Response**: The ``llms.txt`` content, or ``304 Not Modified`` if the client's cached copy is current
 
     """
-    return FileResponse("static/llms.txt")
+    return _static_text_response(request, _LLMS_TXT)
 
 
 @app.get("/docs", response_class=HTMLResponse, include_in_schema=False)
@@ -171,11 +220,20 @@ async def custom_swagger_ui(request: Request) -> HTMLResponse:
     """
     context = {"request": request}
     context.update(get_version_info())
-    return templates.TemplateResponse("swagger_ui.jinja", context)
+    return HTMLResponse(_SWAGGER_UI_TEMPLATE.render(context))
+
+
+@lru_cache(maxsize=1)
+def _openapi_json_bytes() -> bytes:
+    """Return the OpenAPI schema encoded as JSON, built on first use and reused afterwards.
+
+    The routes are fixed once the application has been set up, so the encoded schema never changes at runtime.
+    """
+    return json.dumps(app.openapi(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
 
 
 @app.get("/api", include_in_schema=True)
-def openapi_json_get() -> JSONResponse:
+def openapi_json_get() -> Response:
     """Return the OpenAPI schema.
 
     **This endpoint returns the OpenAPI schema (openapi.json)**
@@ -184,15 +242,15 @@ def openapi_json_get() -> JSONResponse:
 
     **Returns**
 
-    - **JSONResponse**: The OpenAPI schema as JSON
+    - **Response**: The OpenAPI schema as JSON
 
     """
-    return JSONResponse(app.openapi())
+    return Response(content=_openapi_json_bytes(), media_type="application/json")
 
 
 @app.api_route("/api", methods=["POST", "PUT", "DELETE", "OPTIONS", "HEAD"], include_in_schema=False)
 @app.api_route("/api/", methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "HEAD"], include_in_schema=False)
-def openapi_json() -> JSONResponse:
+def openapi_json() -> Response:
     """Return the OpenAPI schema for various HTTP methods.
 
     **This endpoint returns the OpenAPI schema (openapi.json)**
@@ -201,10 +259,10 @@ def openapi_json() -> JSONResponse:
 
     **Returns**
 
-    - **JSONResponse**: The OpenAPI schema as JSON
+    - **Response**: The OpenAPI schema as JSON
 
     """
-    return JSONResponse(app.openapi())
+    return Response(content=_openapi_json_bytes(), media_type="application/json")
 
 
 # Include routers for modular endpoints
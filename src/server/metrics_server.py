@@ -1,46 +1,61 @@
 """Prometheus metrics server running on a separate port."""
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
-from prometheus_client import REGISTRY, generate_latest
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Iterable
+
+from prometheus_client import REGISTRY, start_http_server
 
 from gitingest.utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from prometheus_client.metrics_core import Metric
+    from prometheus_client.registry import CollectorRegistry
+
 # Create a logger for this module
 logger = get_logger(__name__)
 
-# Create a separate FastAPI app for metrics
-metrics_app = FastAPI(
-    title="Gitingest Metrics",
-    description="Prometheus metrics for Gitingest",
-    docs_url=None,
-    redoc_url=None,
-)
+# Scrape results are reused for this long; keep it well below the Prometheus scrape interval
+_METRICS_CACHE_TTL = 5.0  # seconds
 
 
-@metrics_app.get("/metrics")
-async def metrics() -> HTMLResponse:
-    """Serve Prometheus metrics without authentication.
+class _CachedCollectorRegistry:
+    """Registry facade that reuses the collected metrics for ``ttl`` seconds.
 
-    This endpoint is only accessible from the local network.
+    Collecting walks every registered collector, which dominates scrape time. Scrapes arriving within ``ttl`` of the
+    last collection are answered from the cached metric families instead.
+    """
 
-    Returns
-    -------
-    HTMLResponse
-        Prometheus metrics in text format
+    def __init__(self, registry: CollectorRegistry, ttl: float) -> None:
+        self._registry = registry
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._collected_at = float("-inf")
+        self._metrics: list[Metric] = []
 
-    """
-    return HTMLResponse(
-        content=generate_latest(REGISTRY),
-        status_code=200,
-        media_type="text/plain",
-    )
+    def collect(self) -> Iterable[Metric]:
+        """Return the metric families, collecting them again only once the cached ones are older than ``ttl``."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._collected_at >= self._ttl:
+                self._metrics = list(self._registry.collect())
+                self._collected_at = now
+            return iter(self._metrics)
+
+    def restricted_registry(self, names: Iterable[str]) -> CollectorRegistry:
+        """Delegate ``?name[]=...`` filtered scrapes to the underlying registry, uncached."""
+        return self._registry.restricted_registry(names)
 
 
 def start_metrics_server(host: str = "127.0.0.1", port: int = 9090) -> None:
     """Start the metrics server on a separate port.
 
+    The metrics are served by ``prometheus_client``'s own threaded HTTP exporter, which runs in a daemon thread and
+    does not need a second event loop, so scrapes are answered even while the main loop is busy ingesting.
+    Collected metrics are cached for ``_METRICS_CACHE_TTL`` seconds between scrapes.
+
     Parameters
     ----------
     host : str
@@ -54,15 +69,9 @@ def start_metrics_server(host: str = "127.0.0.1", port: int = 9090) -> None:
 
     """
     logger.info("Starting metrics server", extra={"host": host, "port": port})
-
-    # Configure uvicorn to suppress startup messages to avoid duplicates
-    # since the main server already shows similar messages
-    uvicorn.run(
-        metrics_app,
-        host=host,
-        port=port,
-        log_config=None,  # Disable uvicorn's default logging config
-        access_log=False,  # Disable access logging for metrics server
-        # Suppress uvicorn's startup messages by setting log level higher
-        log_level="warning",
-    )
+    registry = _CachedCollectorRegistry(REGISTRY, ttl=_METRICS_CACHE_TTL)
+    try:
+        start_http_server(port, addr=host, registry=registry)  # type: ignore[arg-type]
+    except OSError:
+        # e.g. another worker process already serves metrics on this port; keep serving the application
+        logger.exception("Could not start metrics server", extra={"host": host, "port": port})
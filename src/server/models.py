@@ -1,18 +1,22 @@
-"""Pydantic models for the query form."""
+"""Pydantic models for the ingest API requests and responses."""
 
 from __future__ import annotations
 
 from enum import Enum
 from typing import TYPE_CHECKING, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 from gitingest.utils.compat_func import removesuffix
+from gitingest.utils.compat_typing import Annotated
 from server.server_config import MAX_FILE_SIZE_KB
 
 # needed for type checking (pydantic)
 if TYPE_CHECKING:
-    from server.form_types import IntForm, OptStrForm, StrForm
+    from gitingest.utils.compat_typing import TypeAlias
+
+# Stripping runs inside pydantic-core instead of as a Python validator
+StrippedStr: TypeAlias = Annotated[str, StringConstraints(strip_whitespace=True)]
 
 
 class PatternType(str, Enum):
@@ -40,26 +44,20 @@ class IngestRequest(BaseModel):
 
     """
 
-    input_text: str = Field(..., description="Git repository URL or slug to ingest")
+    input_text: StrippedStr = Field(..., description="Git repository URL or slug to ingest")
     max_file_size: int = Field(..., ge=1, le=MAX_FILE_SIZE_KB, description="File size in KB")
     pattern_type: PatternType = Field(default=PatternType.EXCLUDE, description="Pattern type for file filtering")
-    pattern: str = Field(default="", description="Glob/regex pattern for file filtering")
+    pattern: StrippedStr = Field(default="", description="Glob/regex pattern for file filtering")
     token: str | None = Field(default=None, description="GitHub PAT for private repositories")
 
     @field_validator("input_text")
     @classmethod
     def validate_input_text(cls, v: str) -> str:
-        """Validate that ``input_text`` is not empty."""
-        if not v.strip():
+        """Validate that the already stripped ``input_text`` is not empty, and strip a trailing ``.git``."""
+        if not v:
             err = "input_text cannot be empty"
             raise ValueError(err)
-        return removesuffix(v.strip(), ".git")
-
-    @field_validator("pattern")
-    @classmethod
-    def validate_pattern(cls, v: str) -> str:
-        """Validate ``pattern`` field."""
-        return v.strip()
+        return removesuffix(v, ".git")
 
 
 class IngestSuccessResponse(BaseModel):
@@ -133,66 +131,3 @@ class S3Metadata(BaseModel):
     summary: str = Field(..., description="Ingestion summary with token estimates")
     tree: str = Field(..., description="File tree structure")
     content: str = Field(..., description="Processed file content")
-
-
-class QueryForm(BaseModel):
-    """Form data for the query.
-
-    Attributes
-    ----------
-    input_text : str
-        Text or URL supplied in the form.
-    max_file_size : int
-        The maximum allowed file size for the input, specified by the user.
-    pattern_type : str
-        The type of pattern used for the query (``include`` or ``exclude``).
-    pattern : str
-        Glob/regex pattern string.
-    token : str | None
-        GitHub personal access token (PAT) for accessing private repositories.
-
-    """
-
-    input_text: str
-    max_file_size: int
-    pattern_type: str
-    pattern: str
-    token: str | None = None
-
-    @classmethod
-    def as_form(
-        cls,
-        input_text: StrForm,
-        max_file_size: IntForm,
-        pattern_type: StrForm,
-        pattern: StrForm,
-        token: OptStrForm,
-    ) -> QueryForm:
-        """Create a QueryForm from FastAPI form parameters.
-
-        Parameters
-        ----------
-        input_text : StrForm
-            The input text provided by the user.
-        max_file_size : IntForm
-            The maximum allowed file size for the input.
-        pattern_type : StrForm
-            The type of pattern used for the query (``include`` or ``exclude``).
-        pattern : StrForm
-            Glob/regex pattern string.
-        token : OptStrForm
-            GitHub personal access token (PAT) for accessing private repositories.
-
-        Returns
-        -------
-        QueryForm
-            The QueryForm instance.
-
-        """
-        return cls(
-            input_text=input_text,
-            max_file_size=max_file_size,
-            pattern_type=pattern_type,
-            pattern=pattern,
-            token=token,
-        )
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
-from pathlib import Path
+import tempfile
 from typing import TYPE_CHECKING, cast
 
 from gitingest.clone import clone_repo
 from gitingest.ingestion import ingest_query
 from gitingest.query_parser import parse_remote_repo
-from gitingest.utils.git_utils import resolve_commit, validate_github_token
+from gitingest.utils.cache_utils import TTLCache
+from gitingest.utils.git_utils import resolve_commit, token_fingerprint, validate_github_token
 from gitingest.utils.logging_config import get_logger
 from gitingest.utils.pattern_utils import process_patterns
 from server.models import IngestErrorResponse, IngestResponse, IngestSuccessResponse, PatternType, S3Metadata
@@ -27,20 +29,247 @@ from server.server_config import MAX_DISPLAY_SIZE
 # Initialize logger for this module
 logger = get_logger(__name__)
 
+_CROPPED_CONTENT_BANNER = (
+    f"(Files content cropped to {int(MAX_DISPLAY_SIZE / 1_000)}k characters, download full ingest to see more)\n"
+)
+
+# Successful ingests, keyed on everything that determines the digest (see ``_ingest_cache_key``). Besides the number
+# of entries, the cache bounds the total number of characters of the summaries, trees and contents it holds
+_INGEST_CACHE_TTL = 3600
+_INGEST_CACHE_SIZE = 512
+_INGEST_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
+
+def _cached_ingest_size(entry: tuple[IngestSuccessResponse, Path | None]) -> int:
+    """Return the number of characters of text held by a cached ingest response."""
+    response, _ = entry
+    return len(response.summary) + len(response.tree) + len(response.content)
+
+
+_ingest_cache: TTLCache[Hashable, tuple[IngestSuccessResponse, Path | None]] = TTLCache(
+    ttl=_INGEST_CACHE_TTL,
+    maxsize=_INGEST_CACHE_SIZE,
+    maxweight=_INGEST_CACHE_MAX_CHARS,
+    weigh=_cached_ingest_size,
+)
+
+# Ingests currently running, so that identical concurrent requests share one clone and ingest
+_in_flight_ingests: dict[Hashable, asyncio.Future[IngestResponse]] = {}
+
+# Digests are encoded in chunks of this many characters, and spooled to disk once they exceed this many bytes
+_DIGEST_CHUNK_SIZE = 1 << 20
+
 if TYPE_CHECKING:
-    from gitingest.schemas.cloning import CloneConfig
+    from collections.abc import Awaitable, Callable, Hashable, Iterator
+    from pathlib import Path
+
     from gitingest.schemas.ingestion import IngestionQuery
 
 
-def _cleanup_repository(clone_config: CloneConfig) -> None:
+async def _single_flight(
+    cache_key: Hashable,
+    ingest: Callable[[], Awaitable[IngestResponse]],
+) -> IngestResponse:
+    """Run ``ingest`` unless an ingest for ``cache_key`` is already in flight, in which case share its outcome.
+
+    The first caller runs ``ingest``; callers arriving while it runs await the same future and get its response, or
+    its exception. If the running ingest is cancelled, a waiting caller takes over and runs ``ingest`` itself.
+
+    Parameters
+    ----------
+    cache_key : Hashable
+        The key built by ``_ingest_cache_key``.
+    ingest : Callable[[], Awaitable[IngestResponse]]
+        Coroutine function running the actual ingest.
+
+    Returns
+    -------
+    IngestResponse
+        The response of the ingest this caller ran or joined.
+
+    """
+    while True:
+        in_flight = _in_flight_ingests.get(cache_key)
+        if in_flight is None:
+            break
+        try:
+            # Shielded, so that a waiter disconnecting does not cancel the ingest for everybody else
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            if not in_flight.cancelled():
+                raise
+
+    future: asyncio.Future[IngestResponse] = asyncio.get_running_loop().create_future()
+    # Mark the exception as retrieved, so that a failure nobody else waited for is not reported a second time
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _in_flight_ingests[cache_key] = future
+    try:
+        response = await ingest()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(response)
+    finally:
+        del _in_flight_ingests[cache_key]
+    return response
+
+
+def _ingest_cache_key(query: IngestionQuery, token: str | None) -> Hashable:
+    """Build the ingest cache key for a parsed query.
+
+    The key covers the resolved commit and every option that changes the digest. The token is included as a
+    fingerprint so that a digest produced with one token is never served to a caller without it.
+
+    Parameters
+    ----------
+    query : IngestionQuery
+        The parsed query, with its commit resolved and its patterns processed.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+
+    Returns
+    -------
+    Hashable
+        The cache key.
+
+    """
+    return (
+        query.url,
+        query.commit,
+        query.subpath,
+        query.type,
+        frozenset(query.include_patterns or ()),
+        frozenset(query.ignore_patterns),
+        query.max_file_size,
+        token_fingerprint(token),
+    )
+
+
+def _get_cached_ingest(
+    cache_key: Hashable,
+    input_text: str,
+    pattern_type: PatternType,
+    pattern: str,
+) -> IngestSuccessResponse | None:
+    """Return the cached response for ``cache_key``, adapted to the current request.
+
+    Entries whose local digest file has disappeared are dropped.
+
+    Parameters
+    ----------
+    cache_key : Hashable
+        The key built by ``_ingest_cache_key``.
+    input_text : str
+        Original input text.
+    pattern_type : PatternType
+        Pattern type (include/exclude).
+    pattern : str
+        Pattern string.
+
+    Returns
+    -------
+    IngestSuccessResponse | None
+        The cached response, or ``None`` on a miss.
+
+    """
+    cached = _ingest_cache.get(cache_key)
+    if cached is None:
+        return None
+
+    response, digest_path = cached
+    if digest_path is not None and not digest_path.is_file():
+        _ingest_cache.pop(cache_key)
+        return None
+
+    logger.info("Serving digest from the ingest cache", extra={"digest_url": response.digest_url})
+    return _for_request(response, input_text, pattern_type, pattern)
+
+
+def _for_request(
+    response: IngestSuccessResponse,
+    input_text: str,
+    pattern_type: PatternType,
+    pattern: str,
+) -> IngestSuccessResponse:
+    """Return a copy of a shared ``response`` carrying the current request's input and pattern.
+
+    Parameters
+    ----------
+    response : IngestSuccessResponse
+        A response produced for an identical query.
+    input_text : str
+        Original input text.
+    pattern_type : PatternType
+        Pattern type (include/exclude).
+    pattern : str
+        Pattern string.
+
+    Returns
+    -------
+    IngestSuccessResponse
+        The adapted response.
+
+    """
+    return response.model_copy(update={"repo_url": input_text, "pattern_type": pattern_type, "pattern": pattern})
+
+
+def _cleanup_repository(local_path: Path) -> None:
     """Clean up the cloned repository after processing."""
     try:
-        local_path = Path(clone_config.local_path)
-        if local_path.exists():
-            shutil.rmtree(local_path)
-            logger.info("Successfully cleaned up repository", extra={"local_path": str(local_path)})
+        # Let rmtree report a missing directory instead of checking for it first
+        shutil.rmtree(local_path)
+    except FileNotFoundError:
+        return
     except (PermissionError, OSError):
-        logger.exception("Could not delete repository", extra={"local_path": str(clone_config.local_path)})
+        logger.exception("Could not delete repository", extra={"local_path": str(local_path)})
+    else:
+        logger.info("Successfully cleaned up repository", extra={"local_path": str(local_path)})
+
+
+def _schedule_cleanup(local_path: Path) -> None:
+    """Remove the cloned repository in the default executor, without making the request wait for it.
+
+    ``shutil.rmtree`` on a large checkout issues thousands of ``unlink`` calls; neither the event loop nor the
+    response should block on them.
+
+    Parameters
+    ----------
+    local_path : Path
+        The path of the cloned repository.
+
+    """
+    asyncio.get_running_loop().run_in_executor(None, _cleanup_repository, local_path)
+
+
+def _s3_file_path(query: IngestionQuery) -> str:
+    """Return the S3 key of the query's digest, generating it on first use.
+
+    Parameters
+    ----------
+    query : IngestionQuery
+        The parsed query, with its commit resolved.
+
+    Returns
+    -------
+    str
+        The S3 file path of the digest.
+
+    """
+    if query.s3_file_path is None:
+        query.s3_file_path = generate_s3_file_path(
+            source=cast("str", query.url),
+            user_name=cast("str", query.user_name),
+            repo_name=cast("str", query.repo_name),
+            commit=cast("str", query.commit),
+            subpath=query.subpath,
+            include_patterns=query.include_patterns,
+            ignore_patterns=query.ignore_patterns,
+        )
+    return query.s3_file_path
 
 
 async def _check_s3_cache(
@@ -85,32 +314,27 @@ async def _check_s3_cache(
         logger.info("Commit resolved successfully", extra={"repo_url": query.url, "commit": query.commit})
 
         # Generate S3 file path using the resolved commit
-        s3_file_path = generate_s3_file_path(
-            source=query.url,
-            user_name=cast("str", query.user_name),
-            repo_name=cast("str", query.repo_name),
-            commit=query.commit,
-            subpath=query.subpath,
-            include_patterns=query.include_patterns,
-            ignore_patterns=query.ignore_patterns,
-        )
+        s3_file_path = _s3_file_path(query)
 
-        # Check if file exists on S3
-        if check_s3_object_exists(s3_file_path):
+        # Check if file exists on S3 and fetch its cached metadata concurrently, off the event loop
+        loop = asyncio.get_running_loop()
+        exists, metadata = await asyncio.gather(
+            loop.run_in_executor(None, check_s3_object_exists, s3_file_path),
+            loop.run_in_executor(None, get_metadata_from_s3, s3_file_path),
+        )
+        if exists:
             # File exists on S3, serve it directly without cloning
             s3_url = _build_s3_url(s3_file_path)
             query.s3_url = s3_url
 
             short_repo_url = f"{query.user_name}/{query.repo_name}"
 
-            # Try to get cached metadata
-            metadata = get_metadata_from_s3(s3_file_path)
-
             if metadata:
                 # Use cached metadata if available
                 summary = metadata.summary
                 tree = metadata.tree
-                content = metadata.content
+                # The metadata holds the full content; the response (and the ingest cache) only needs what is shown
+                content = _crop_content(metadata.content)
             else:
                 # Fallback to placeholder messages if metadata not available
                 summary = "Digest served from cache (S3). Download the full digest to see content details."
@@ -136,65 +360,157 @@ async def _check_s3_cache(
     return None
 
 
-def _store_digest_content(
+async def _store_digest_content(
     query: IngestionQuery,
-    clone_config: CloneConfig,
-    digest_content: str,
     summary: str,
     tree: str,
     content: str,
-) -> None:
+) -> Path | None:
     """Store digest content either to S3 or locally based on configuration.
 
+    The digest is ``tree``, a newline, then ``content``.
+
     Parameters
     ----------
     query : IngestionQuery
         The query object containing repository information.
-    clone_config : CloneConfig
-        The clone configuration object.
-    digest_content : str
-        The complete digest content to store.
     summary : str
         The summary content for metadata.
     tree : str
-        The tree content for metadata.
+        The tree content of the digest.
     content : str
-        The file content for metadata.
+        The file content of the digest.
+
+    Returns
+    -------
+    Path | None
+        The local digest file, or ``None`` if the digest was uploaded to S3.
 
     """
+    # Writing or uploading a multi-MB digest is blocking I/O; run it in the default executor to keep the loop free
+    loop = asyncio.get_running_loop()
     if is_s3_enabled():
-        # Upload to S3 instead of storing locally
-        s3_file_path = generate_s3_file_path(
-            source=query.url,
-            user_name=cast("str", query.user_name),
-            repo_name=cast("str", query.repo_name),
-            commit=query.commit,
-            subpath=query.subpath,
-            include_patterns=query.include_patterns,
-            ignore_patterns=query.ignore_patterns,
-        )
-        s3_url = upload_to_s3(content=digest_content, s3_file_path=s3_file_path, ingest_id=query.id)
+        query.s3_url = await loop.run_in_executor(None, _upload_digest_to_s3, query, summary, tree, content)
+        return None
 
-        # Also upload metadata JSON for caching
-        metadata = S3Metadata(
-            summary=summary,
-            tree=tree,
-            content=content,
-        )
-        try:
-            upload_metadata_to_s3(metadata=metadata, s3_file_path=s3_file_path, ingest_id=query.id)
-            logger.info("Successfully uploaded metadata to S3")
-        except Exception as metadata_exc:
-            # Log the error but don't fail the entire request
-            logger.warning("Failed to upload metadata to S3", extra={"error": str(metadata_exc)})
-
-        # Store S3 URL in query for later use
-        query.s3_url = s3_url
-    else:
-        # Store locally
-        local_txt_file = Path(clone_config.local_path).with_suffix(".txt")
-        with local_txt_file.open("w", encoding="utf-8") as f:
-            f.write(digest_content)
+    local_txt_file = query.local_path.with_suffix(".txt")
+    await loop.run_in_executor(None, _write_digest, local_txt_file, tree, content)
+    return local_txt_file
+
+
+def _upload_digest_to_s3(query: IngestionQuery, summary: str, tree: str, content: str) -> str:
+    """Upload the digest and its metadata to S3.
+
+    Parameters
+    ----------
+    query : IngestionQuery
+        The query object containing repository information.
+    summary : str
+        The summary content for metadata.
+    tree : str
+        The tree content of the digest.
+    content : str
+        The file content of the digest.
+
+    Returns
+    -------
+    str
+        The public URL of the uploaded digest.
+
+    """
+    s3_file_path = _s3_file_path(query)
+    with _spool_digest(tree, content) as digest_file:
+        s3_url = upload_to_s3(content=digest_file, s3_file_path=s3_file_path, ingest_id=query.id)
+
+    # Also upload metadata JSON for caching
+    metadata = S3Metadata(
+        summary=summary,
+        tree=tree,
+        content=content,
+    )
+    try:
+        upload_metadata_to_s3(metadata=metadata, s3_file_path=s3_file_path, ingest_id=query.id)
+        logger.info("Successfully uploaded metadata to S3")
+    except Exception as metadata_exc:
+        # Log the error but don't fail the entire request
+        logger.warning("Failed to upload metadata to S3", extra={"error": str(metadata_exc)})
+
+    return s3_url
+
+
+def _write_digest(path: Path, tree: str, content: str) -> None:
+    """Write the UTF-8 encoded digest to ``path`` chunk by chunk.
+
+    Neither the concatenated digest nor its full encoding is ever held in memory, and the 1 MiB write buffer keeps
+    the number of ``write`` syscalls low. The digest is written to a ``.part`` file next to ``path`` and renamed into
+    place once complete, so a concurrent download never sees a truncated digest.
+
+    Parameters
+    ----------
+    path : Path
+        The file to write the digest to.
+    tree : str
+        The tree content of the digest.
+    content : str
+        The file content of the digest.
+
+    """
+    part_path = path.with_name(path.name + ".part")
+    try:
+        with part_path.open("wb", buffering=_DIGEST_CHUNK_SIZE) as f:
+            f.writelines(_iter_digest_chunks(tree, content))
+        part_path.replace(path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+def _iter_digest_chunks(tree: str, content: str) -> Iterator[bytes]:
+    """Yield the UTF-8 encoded digest in chunks of at most ``_DIGEST_CHUNK_SIZE`` characters.
+
+    Parameters
+    ----------
+    tree : str
+        The tree content of the digest.
+    content : str
+        The file content of the digest.
+
+    Yields
+    ------
+    bytes
+        The next encoded chunk of the digest.
+
+    """
+    yield tree.encode("utf-8")
+    yield b"\n"
+    for start in range(0, len(content), _DIGEST_CHUNK_SIZE):
+        yield content[start : start + _DIGEST_CHUNK_SIZE].encode("utf-8")
+
+
+def _spool_digest(tree: str, content: str) -> tempfile.SpooledTemporaryFile[bytes]:
+    """Encode the digest into a spooled temporary file, ready to be streamed to S3.
+
+    Small digests stay in memory; larger ones roll over to disk, so the full encoded digest is never held in memory
+    next to ``content``.
+
+    Parameters
+    ----------
+    tree : str
+        The tree content of the digest.
+    content : str
+        The file content of the digest.
+
+    Returns
+    -------
+    tempfile.SpooledTemporaryFile[bytes]
+        The encoded digest, positioned at the start.
+
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=_DIGEST_CHUNK_SIZE)  # noqa: SIM115 (closed by the caller)
+    for chunk in _iter_digest_chunks(tree, content):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
 
 
 def _generate_digest_url(query: IngestionQuery) -> str:
@@ -278,6 +594,69 @@ async def process_query(
         include_patterns=pattern if pattern_type == PatternType.INCLUDE else None,
     )
 
+    cache_key = _ingest_cache_key(query, token)
+
+    cached_response = _get_cached_ingest(cache_key, input_text, pattern_type, pattern)
+    if cached_response:
+        return cached_response
+
+    response = await _single_flight(
+        cache_key,
+        lambda: _ingest_repository(
+            query=query,
+            cache_key=cache_key,
+            input_text=input_text,
+            max_file_size=max_file_size,
+            pattern_type=pattern_type,
+            pattern=pattern,
+            token=token,
+        ),
+    )
+    if isinstance(response, IngestSuccessResponse):
+        # The response may come from an identical ingest started by another request; report this request's own input
+        response = _for_request(response, input_text, pattern_type, pattern)
+    return response
+
+
+async def _ingest_repository(  # pylint: disable=too-many-arguments
+    query: IngestionQuery,
+    cache_key: Hashable,
+    input_text: str,
+    max_file_size: int,
+    pattern_type: PatternType,
+    pattern: str,
+    token: str | None,
+) -> IngestResponse:
+    """Clone and ingest the repository of a parsed query, and cache a successful response.
+
+    Parameters
+    ----------
+    query : IngestionQuery
+        The parsed query, with its commit resolved and its patterns processed.
+    cache_key : Hashable
+        The key built by ``_ingest_cache_key``.
+    input_text : str
+        Original input text.
+    max_file_size : int
+        Max file size in KB to be include in the digest.
+    pattern_type : PatternType
+        Pattern type (include/exclude).
+    pattern : str
+        Pattern string.
+    token : str | None
+        GitHub personal access token (PAT) for accessing private repositories.
+
+    Returns
+    -------
+    IngestResponse
+        A union type, corresponding to IngestErrorResponse or IngestSuccessResponse
+
+    Raises
+    ------
+    RuntimeError
+        If the commit hash is not found (should never happen).
+
+    """
     # Check if digest already exists on S3 before cloning
     s3_response = await _check_s3_cache(
         query=query,
@@ -288,6 +667,7 @@ async def process_query(
         token=token,
     )
     if s3_response:
+        _ingest_cache.set(cache_key, (s3_response, None))
         return s3_response
 
     clone_config = query.extract_clone_config()
@@ -301,20 +681,18 @@ async def process_query(
         raise RuntimeError(msg)
 
     try:
-        summary, tree, content = ingest_query(query)
-        digest_content = tree + "\n" + content
-        _store_digest_content(query, clone_config, digest_content, summary, tree, content)
+        # Walking and reading the repository is blocking work; keep the event loop free for other requests
+        loop = asyncio.get_running_loop()
+        summary, tree, content = await loop.run_in_executor(None, ingest_query, query)
+        digest_path = await _store_digest_content(query, summary, tree, content)
     except Exception as exc:
         _print_error(query.url, exc, max_file_size, pattern_type, pattern)
         # Clean up repository even if processing failed
-        _cleanup_repository(clone_config)
+        _schedule_cleanup(query.local_path)
         return IngestErrorResponse(error=f"{exc!s}")
 
-    if len(content) > MAX_DISPLAY_SIZE:
-        content = (
-            f"(Files content cropped to {int(MAX_DISPLAY_SIZE / 1_000)}k characters, "
-            "download full ingest to see more)\n" + content[:MAX_DISPLAY_SIZE]
-        )
+    # Rebinding drops the only reference to the full content, so it is freed before the response is built
+    content = _crop_content(content)
 
     _print_success(
         url=query.url,
@@ -327,9 +705,9 @@ async def process_query(
     digest_url = _generate_digest_url(query)
 
     # Clean up the repository after successful processing
-    _cleanup_repository(clone_config)
+    _schedule_cleanup(query.local_path)
 
-    return IngestSuccessResponse(
+    response = IngestSuccessResponse(
         repo_url=input_text,
         short_repo_url=short_repo_url,
         summary=summary,
@@ -340,34 +718,15 @@ async def process_query(
         pattern_type=pattern_type,
         pattern=pattern,
     )
+    _ingest_cache.set(cache_key, (response, digest_path))
+    return response
 
 
-def _print_query(url: str, max_file_size: int, pattern_type: str, pattern: str) -> None:
-    """Print a formatted summary of the query details for debugging.
-
-    Parameters
-    ----------
-    url : str
-        The URL associated with the query.
-    max_file_size : int
-        The maximum file size allowed for the query, in bytes.
-    pattern_type : str
-        Specifies the type of pattern to use, either "include" or "exclude".
-    pattern : str
-        The actual pattern string to include or exclude in the query.
-
-    """
-    default_max_file_kb = 50
-    logger.info(
-        "Processing query",
-        extra={
-            "url": url,
-            "max_file_size_kb": int(max_file_size / 1024),
-            "pattern_type": pattern_type,
-            "pattern": pattern,
-            "custom_size": int(max_file_size / 1024) != default_max_file_kb,
-        },
-    )
+def _crop_content(content: str) -> str:
+    """Crop ``content`` to ``MAX_DISPLAY_SIZE`` characters for display, prefixed with a banner if it was cropped."""
+    if len(content) <= MAX_DISPLAY_SIZE:
+        return content
+    return _CROPPED_CONTENT_BANNER + content[:MAX_DISPLAY_SIZE]
 
 
 def _print_error(url: str, exc: Exception, max_file_size: int, pattern_type: str, pattern: str) -> None:
@@ -380,7 +739,7 @@ def _print_error(url: str, exc: Exception, max_file_size: int, pattern_type: str
     exc : Exception
         The exception raised during the query or process.
     max_file_size : int
-        The maximum file size allowed for the query, in bytes.
+        The maximum file size allowed for the query, in KB.
     pattern_type : str
         Specifies the type of pattern to use, either "include" or "exclude".
     pattern : str
@@ -391,7 +750,7 @@ def _print_error(url: str, exc: Exception, max_file_size: int, pattern_type: str
         "Query processing failed",
         extra={
             "url": url,
-            "max_file_size_kb": int(max_file_size / 1024),
+            "max_file_size_kb": max_file_size,
             "pattern_type": pattern_type,
             "pattern": pattern,
             "error": str(exc),
@@ -407,7 +766,7 @@ def _print_success(url: str, max_file_size: int, pattern_type: str, pattern: str
     url : str
         The URL associated with the successful query.
     max_file_size : int
-        The maximum file size allowed for the query, in bytes.
+        The maximum file size allowed for the query, in KB.
     pattern_type : str
         Specifies the type of pattern to use, either "include" or "exclude".
     pattern : str
@@ -416,12 +775,14 @@ def _print_success(url: str, max_file_size: int, pattern_type: str, pattern: str
         A summary of the query result, including details like estimated tokens.
 
     """
-    estimated_tokens = summary[summary.index("Estimated tokens:") + len("Estimated ") :]
+    # The token estimate is the summary's last line, so search from the end; a repository name containing "Estimated "
+    # cannot shadow it. Empty when the summary has no token estimate (e.g. the tokenizer failed).
+    _, _, estimated_tokens = summary.rpartition("\nEstimated ")
     logger.info(
         "Query processing completed successfully",
         extra={
             "url": url,
-            "max_file_size_kb": int(max_file_size / 1024),
+            "max_file_size_kb": max_file_size,
             "pattern_type": pattern_type,
             "pattern": pattern,
             "estimated_tokens": estimated_tokens,
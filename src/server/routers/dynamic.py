@@ -1,15 +1,37 @@
 """The dynamic router module defines handlers for dynamic path requests."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import Response  # noqa: TC002 (typing-only-third-party-import) needed at runtime (FastAPI)
 
 from server.server_config import get_version_info, templates
+from server.server_utils import canonical_page_url, encode_html_page, html_page_response
 
 router = APIRouter()
 
+# Resolve the template once instead of going through the Jinja loader on every request
+_GIT_TEMPLATE = templates.get_template("git.jinja")
+
+# Everything but the request and the repository URL is the same for every render, so build it once
+_GIT_CONTEXT = {
+    "default_max_file_size": 243,
+    **get_version_info(),
+}
+
+
+@lru_cache(maxsize=1024)
+def _render_git_page(page_url: str, repo_url: str) -> tuple[bytes, str]:
+    """Render the repository page and compute its ETag, once per distinct page URL."""
+    # The templates only read ``request.url`` (for the Open Graph tags), so the URLs are all the render depends on
+    context = {"request": {"url": page_url}, "repo_url": repo_url, **_GIT_CONTEXT}
+    return encode_html_page(_GIT_TEMPLATE.render(context))
+
 
 @router.get("/{full_path:path}", include_in_schema=False)
-async def catch_all(request: Request, full_path: str) -> HTMLResponse:
+async def catch_all(request: Request, full_path: str) -> Response:
     """Render a page with a Git URL based on the provided path.
 
     This endpoint catches all GET requests with a dynamic path, constructs a Git URL
@@ -24,16 +46,10 @@ async def catch_all(request: Request, full_path: str) -> HTMLResponse:
 
     Returns
     -------
-    HTMLResponse
+    Response
         An HTML response containing the rendered template, with the Git URL
-        and other default parameters such as file size.
+        and other default parameters such as file size, or an empty ``304`` response if the client's copy is current.
 
     """
-    context = {
-        "request": request,
-        "repo_url": full_path,
-        "default_max_file_size": 243,
-    }
-    context.update(get_version_info())
-
-    return templates.TemplateResponse("git.jinja", context)
+    # The query string is left out of the cache key and ``og:url``, so that it cannot be used to bypass the cache
+    return html_page_response(request, _render_git_page(canonical_page_url(request), full_path))
@@ -1,15 +1,37 @@
 """Module defining the FastAPI router for the home page of the application."""
 
+from __future__ import annotations
+
+from functools import lru_cache
+
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
 from server.server_config import EXAMPLE_REPOS, get_version_info, templates
+from server.server_utils import canonical_page_url, encode_html_page, html_page_response
 
 router = APIRouter()
 
+# Resolve the template once instead of going through the Jinja loader on every request
+_INDEX_TEMPLATE = templates.get_template("index.jinja")
+
+# Everything but the request is the same for every render, so build it once
+_INDEX_CONTEXT = {
+    "examples": EXAMPLE_REPOS,
+    "default_max_file_size": 243,
+    **get_version_info(),
+}
+
+
+@lru_cache(maxsize=64)
+def _render_home(page_url: str) -> tuple[bytes, str]:
+    """Render the home page for ``page_url`` and compute its ETag, once per distinct URL."""
+    # The templates only read ``request.url`` (for the Open Graph tags), so the URL is all the render depends on
+    return encode_html_page(_INDEX_TEMPLATE.render({"request": {"url": page_url}, **_INDEX_CONTEXT}))
+
 
 @router.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def home(request: Request) -> HTMLResponse:
+async def home(request: Request) -> Response:
     """Render the home page with example repositories and default parameters.
 
     This endpoint serves the home page of the application, rendering the ``index.jinja`` template
@@ -22,16 +44,10 @@ async def home(request: Request) -> HTMLResponse:
 
     Returns
     -------
-    HTMLResponse
+    Response
         An HTML response containing the rendered home page template, with example repositories
-        and other default parameters such as file size.
+        and other default parameters such as file size, or an empty ``304`` response if the client's copy is current.
 
     """
-    context = {
-        "request": request,
-        "examples": EXAMPLE_REPOS,
-        "default_max_file_size": 243,
-    }
-    context.update(get_version_info())
-
-    return templates.TemplateResponse("index.jinja", context)
+    # The query string is left out of the cache key and ``og:url``, so that it cannot be used to bypass the cache
+    return html_page_response(request, _render_home(canonical_page_url(request)))
@@ -1,30 +1,51 @@
 """Ingest endpoint for the API."""
 
+import os
 from typing import Union
+from urllib.parse import quote, urlparse
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Request, status
-from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse, Response
 from prometheus_client import Counter
 
 from gitingest.config import TMP_BASE_PATH
+from gitingest.utils.query_parser_utils import KNOWN_GIT_HOSTS
 from server.models import IngestRequest
 from server.routers_utils import COMMON_INGEST_RESPONSES, _perform_ingestion
 from server.s3_utils import is_s3_enabled
-from server.server_config import DEFAULT_FILE_SIZE_KB
+from server.server_config import DEFAULT_FILE_SIZE_KB, DOWNLOAD_ACCEL_REDIRECT_PREFIX
 from server.server_utils import limiter
 
-ingest_counter = Counter("gitingest_ingest_total", "Number of ingests", ["status", "url"])
+# Labelled by Git host rather than by URL, so the number of series stays bounded
+ingest_counter = Counter("gitingest_ingest_total", "Number of ingests", ["status", "host"])
+
+_KNOWN_HOST_LABELS = frozenset(KNOWN_GIT_HOSTS)
 
 router = APIRouter()
 
+# Resolved once, so the download endpoint only joins strings per request
+_TMP_BASE_DIR = str(TMP_BASE_PATH.resolve())
+
+
+def _host_label(input_text: str) -> str:
+    """Return the ``host`` metric label for ``input_text``: a known Git host, ``slug`` or ``other``."""
+    try:
+        host = urlparse(input_text if "://" in input_text else f"https://{input_text}").hostname or ""
+    except ValueError:
+        return "other"
+    if host in _KNOWN_HOST_LABELS:
+        return host
+    # ``user/repo`` parses with ``user`` as the host
+    return "other" if "." in host else "slug"
+
 
 @router.post("/api/ingest", responses=COMMON_INGEST_RESPONSES)
 @limiter.limit("10/minute")
 async def api_ingest(
     request: Request,  # noqa: ARG001 (unused-function-argument) # pylint: disable=unused-argument
     ingest_request: IngestRequest,
-) -> JSONResponse:
+) -> Response:
     """Ingest a Git repository and return processed content.
 
     **This endpoint processes a Git repository by cloning it, analyzing its structure,**
@@ -37,7 +58,7 @@ async def api_ingest(
 
     **Returns**
 
-    - **JSONResponse**: Success response with ingestion results or error response with appropriate HTTP status code
+    - **Response**: JSON success response with ingestion results or error response with appropriate HTTP status code
 
     """
     response = await _perform_ingestion(
@@ -47,8 +68,7 @@ async def api_ingest(
         pattern=ingest_request.pattern,
         token=ingest_request.token,
     )
-    # limit URL to 255 characters
-    ingest_counter.labels(status=response.status_code, url=ingest_request.input_text[:255]).inc()
+    ingest_counter.labels(status=response.status_code, host=_host_label(ingest_request.input_text)).inc()
     return response
 
 
@@ -62,7 +82,7 @@ async def api_ingest_get(
     pattern_type: str = "exclude",
     pattern: str = "",
     token: str = "",
-) -> JSONResponse:
+) -> Response:
     """Ingest a GitHub repository via GET and return processed content.
 
     **This endpoint processes a GitHub repository by analyzing its structure and returning a summary**
@@ -80,7 +100,7 @@ async def api_ingest_get(
     - **token** (`str`, optional): GitHub personal access token for private repositories (default: "")
 
     **Returns**
-    - **JSONResponse**: Success response with ingestion results or error response with appropriate HTTP status code
+    - **Response**: JSON success response with ingestion results or error response with appropriate HTTP status code
     """
     response = await _perform_ingestion(
         input_text=f"{user}/{repository}",
@@ -89,15 +109,14 @@ async def api_ingest_get(
         pattern=pattern,
         token=token or None,
     )
-    # limit URL to 255 characters
-    ingest_counter.labels(status=response.status_code, url=f"{user}/{repository}"[:255]).inc()
+    ingest_counter.labels(status=response.status_code, host="slug").inc()
     return response
 
 
 @router.get("/api/download/file/{ingest_id}", response_model=None)
 async def download_ingest(
     ingest_id: UUID,
-) -> Union[RedirectResponse, FileResponse]:  # noqa: FA100 (future-rewritable-type-annotation) (pydantic)
+) -> Union[RedirectResponse, FileResponse, Response]:  # noqa: FA100 (future-rewritable-type-annotation) (pydantic)
     """Download the first text file produced for an ingest ID.
 
     **This endpoint retrieves the first ``*.txt`` file produced during the ingestion process**
@@ -111,6 +130,8 @@ async def download_ingest(
     **Returns**
 
     - **FileResponse**: Streamed response with media type ``text/plain`` for local files
+    - **Response**: Empty response with an ``X-Accel-Redirect`` header when
+      ``GITINGEST_DOWNLOAD_ACCEL_REDIRECT_PREFIX`` is set, letting nginx send the file
 
     **Raises**
 
@@ -128,26 +149,52 @@ async def download_ingest(
         )
 
     # Fall back to local file serving
-    # Normalize and validate the directory path
-    directory = (TMP_BASE_PATH / str(ingest_id)).resolve()
-    if not str(directory).startswith(str(TMP_BASE_PATH.resolve())):
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=f"Invalid ingest ID: {ingest_id!r}")
-
-    if not directory.is_dir():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Digest {ingest_id!r} not found")
+    # ``ingest_id`` is validated as a UUID, so its string form cannot contain a separator or ``..``
+    directory = os.path.join(_TMP_BASE_DIR, str(ingest_id))  # noqa: PTH118 (os-path-join) hot path, avoids Path objects
 
+    # A single directory scan both checks that the digest exists and finds its file
     try:
-        first_txt_file = next(directory.glob("*.txt"))
-    except StopIteration as exc:
+        with os.scandir(directory) as entries:
+            first_txt_file = next(
+                (entry for entry in entries if entry.name.endswith(".txt") and entry.is_file()),
+                None,
+            )
+    except (FileNotFoundError, NotADirectoryError) as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Digest {ingest_id!r} not found") from exc
+    except PermissionError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Permission denied for digest {ingest_id!r}",
+        ) from exc
+
+    if first_txt_file is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No .txt file found for digest {ingest_id!r}",
-        ) from exc
+        )
+
+    if DOWNLOAD_ACCEL_REDIRECT_PREFIX:
+        # nginx streams the file itself; the worker does not copy the digest
+        quoted_name = quote(first_txt_file.name)
+        return Response(
+            media_type="text/plain",
+            headers={
+                "X-Accel-Redirect": f"{DOWNLOAD_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{ingest_id}/{quoted_name}",
+                "Content-Disposition": f"attachment; filename*=utf-8''{quoted_name}",
+            },
+        )
 
     try:
-        return FileResponse(path=first_txt_file, media_type="text/plain", filename=first_txt_file.name)
+        # Handing over the stat result spares FileResponse a second ``stat`` in a worker thread
+        return FileResponse(
+            path=first_txt_file.path,
+            media_type="text/plain",
+            filename=first_txt_file.name,
+            stat_result=first_txt_file.stat(),
+            content_disposition_type="attachment",
+        )
     except PermissionError as exc:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Permission denied for {first_txt_file}",
+            detail=f"Permission denied for {first_txt_file.path}",
         ) from exc
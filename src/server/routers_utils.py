@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from server.models import IngestErrorResponse, IngestSuccessResponse, PatternType
 from server.query_processor import process_query
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
 COMMON_INGEST_RESPONSES: dict[int | str, dict[str, Any]] = {
     status.HTTP_200_OK: {"model": IngestSuccessResponse, "description": "Successful ingestion"},
     status.HTTP_400_BAD_REQUEST: {"model": IngestErrorResponse, "description": "Bad request or processing error"},
@@ -23,8 +26,8 @@ async def _perform_ingestion(
     pattern_type: str,
     pattern: str,
     token: str | None,
-) -> JSONResponse:
-    """Run ``process_query`` and wrap the result in a ``FastAPI`` ``JSONResponse``.
+) -> Response:
+    """Run ``process_query`` and wrap the result in a JSON ``Response``.
 
     Consolidates error handling shared by the ``POST`` and ``GET`` ingest endpoints.
     """
@@ -41,17 +44,39 @@ async def _perform_ingestion(
 
         if isinstance(result, IngestErrorResponse):
             # Return structured error response with 400 status code
-            return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=result.model_dump())
+            return _json_response(result, status_code=status.HTTP_400_BAD_REQUEST)
 
         # Return structured success response with 200 status code
-        return JSONResponse(status_code=status.HTTP_200_OK, content=result.model_dump())
+        return _json_response(result, status_code=status.HTTP_200_OK)
 
     except ValueError as ve:
         # Handle validation errors with 400 status code
         error_response = IngestErrorResponse(error=f"Validation error: {ve!s}")
-        return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=error_response.model_dump())
+        return _json_response(error_response, status_code=status.HTTP_400_BAD_REQUEST)
 
     except Exception as exc:
         # Handle unexpected errors with 500 status code
         error_response = IngestErrorResponse(error=f"Internal server error: {exc!s}")
-        return JSONResponse(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, content=error_response.model_dump())
+        return _json_response(error_response, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+def _json_response(model: BaseModel, status_code: int) -> Response:
+    """Serialize ``model`` straight to JSON bytes with pydantic's Rust encoder.
+
+    This skips the ``model_dump()`` dict and the stdlib ``json.dumps`` pass that ``JSONResponse`` would run over the
+    (potentially multi-megabyte) digest.
+
+    Parameters
+    ----------
+    model : BaseModel
+        The response model to serialize.
+    status_code : int
+        The HTTP status code of the response.
+
+    Returns
+    -------
+    Response
+        A ``Response`` with media type ``application/json``.
+
+    """
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import gzip
 import hashlib
+import io
 import os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 from uuid import UUID  # noqa: TC003 (typing-only-standard-library-import) needed for type checking (pydantic)
 
-import boto3
 from botocore.exceptions import ClientError
 from prometheus_client import Counter
 
@@ -16,6 +18,9 @@ from gitingest.utils.logging_config import get_logger
 from server.models import S3Metadata
 
 if TYPE_CHECKING:
+    from typing import IO
+
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import BaseClient
 
 
@@ -26,18 +31,30 @@ _s3_ingest_lookup_counter = Counter("gitingest_s3_ingest_lookup", "Number of S3
 _s3_ingest_hit_counter = Counter("gitingest_s3_ingest_hit", "Number of S3 ingest file cache hits")
 _s3_ingest_miss_counter = Counter("gitingest_s3_ingest_miss", "Number of S3 ingest file cache misses")
 
+# Digests above 8 MiB are uploaded as a multipart upload, sending up to 8 parts in parallel
+_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+_MULTIPART_CONCURRENCY = 8
+
+# Connections kept open by the shared S3 client; enough for every executor thread plus multipart upload parts
+_MAX_POOL_CONNECTIONS = 64
+
+# The metadata JSON embeds the full digest content; it is only read back by this server, so store it gzip-compressed
+_METADATA_COMPRESSLEVEL = 5
+
 
 class S3UploadError(Exception):
     """Custom exception for S3 upload failures."""
 
 
+@lru_cache(maxsize=1)
 def is_s3_enabled() -> bool:
-    """Check if S3 is enabled via environment variables."""
+    """Check if S3 is enabled via environment variables, read once per process."""
     return os.getenv("S3_ENABLED", "false").lower() == "true"
 
 
+@lru_cache(maxsize=1)
 def get_s3_config() -> dict[str, str | None]:
-    """Get S3 configuration from environment variables."""
+    """Get S3 configuration from environment variables, read once per process; callers must not mutate it."""
     config = {
         "endpoint_url": os.getenv("S3_ENDPOINT"),
         "aws_access_key_id": os.getenv("S3_ACCESS_KEY"),
@@ -47,13 +64,15 @@ def get_s3_config() -> dict[str, str | None]:
     return {k: v for k, v in config.items() if v is not None}
 
 
+@lru_cache(maxsize=1)
 def get_s3_bucket_name() -> str:
-    """Get S3 bucket name from environment variables."""
+    """Get S3 bucket name from environment variables, read once per process."""
     return os.getenv("S3_BUCKET_NAME", "gitingest-bucket")
 
 
+@lru_cache(maxsize=1)
 def get_s3_alias_host() -> str | None:
-    """Get S3 alias host for public URLs."""
+    """Get S3 alias host for public URLs, read once per process."""
     return os.getenv("S3_ALIAS_HOST")
 
 
@@ -117,8 +136,11 @@ def generate_s3_file_path(
     subpath_hash = hashlib.sha256(subpath.encode()).hexdigest()[:16]
 
     file_name = f"{user_name}-{repo_name}-{subpath_hash}.txt"
-    base_path = f"ingest/{hostname}/{user_name}/{repo_name}/{commit}/{patterns_hash}/{file_name}"
+    return _with_directory_prefix(f"ingest/{hostname}/{user_name}/{repo_name}/{commit}/{patterns_hash}/{file_name}")
+
 
+def _with_directory_prefix(base_path: str) -> str:
+    """Prefix ``base_path`` with ``S3_DIRECTORY_PREFIX`` if that environment variable is set."""
     # Check for S3_DIRECTORY_PREFIX environment variable
     s3_directory_prefix = os.getenv("S3_DIRECTORY_PREFIX")
 
@@ -130,8 +152,17 @@ def generate_s3_file_path(
     return f"{s3_directory_prefix}/{base_path}"
 
 
+@lru_cache(maxsize=1)
 def create_s3_client() -> BaseClient:
-    """Create and return an S3 client with configuration from environment."""
+    """Return the process-wide S3 client, creating it from the environment configuration on first use.
+
+    The client is thread-safe, so one instance (and its pool of HTTPS connections) is shared by every request instead
+    of paying for a new client and TLS handshake on each S3 call.
+    """
+    # boto3 takes a noticeable share of the server's import time and is only needed when S3 is enabled
+    import boto3  # noqa: PLC0415 (import-outside-top-level)
+    from botocore.config import Config  # noqa: PLC0415 (import-outside-top-level)
+
     config = get_s3_config()
     # Log S3 client creation (excluding sensitive info)
     log_config = config.copy()
@@ -143,19 +174,37 @@ def create_s3_client() -> BaseClient:
             "has_credentials": has_credentials,
         },
     )
-    return boto3.client("s3", **config)
+    client_config = Config(
+        max_pool_connections=_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+    return boto3.session.Session().client("s3", config=client_config, **config)
 
 
-def upload_to_s3(content: str, s3_file_path: str, ingest_id: UUID) -> str:
+@lru_cache(maxsize=1)
+def _digest_transfer_config() -> TransferConfig:
+    """Return the transfer configuration used for digest uploads, importing ``boto3`` on first use."""
+    from boto3.s3.transfer import TransferConfig  # noqa: PLC0415 (import-outside-top-level)
+
+    return TransferConfig(
+        multipart_threshold=_MULTIPART_CHUNK_SIZE,
+        multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+        max_concurrency=_MULTIPART_CONCURRENCY,
+    )
+
+
+def upload_to_s3(content: str | IO[bytes], s3_file_path: str, ingest_id: UUID) -> str:
     """Upload content to S3 and return the public URL.
 
     This function uploads the provided content to an S3 bucket and returns the public URL for the uploaded file.
-    The ingest ID is stored as an S3 object tag.
+    The ingest ID is stored as an S3 object tag. Large digests can be passed as a seekable binary file object, which
+    is streamed to S3 instead of being encoded in memory. Digests above 8 MiB are sent as a parallel multipart upload.
 
     Parameters
     ----------
-    content : str
-        The digest content to upload.
+    content : str | IO[bytes]
+        The digest content to upload, either as text or as a seekable binary file object.
     s3_file_path : str
         The S3 file path where the content will be stored.
     ingest_id : UUID
@@ -182,11 +231,15 @@ def upload_to_s3(content: str, s3_file_path: str, ingest_id: UUID) -> str:
     s3_client = create_s3_client()
     bucket_name = get_s3_bucket_name()
 
+    body = io.BytesIO(content.encode("utf-8")) if isinstance(content, str) else content
+    content_size = body.seek(0, os.SEEK_END)
+    body.seek(0)
+
     extra_fields = {
         "bucket_name": bucket_name,
         "s3_file_path": s3_file_path,
         "ingest_id": str(ingest_id),
-        "content_size": len(content),
+        "content_size": content_size,
     }
 
     # Log upload attempt
@@ -194,12 +247,12 @@ def upload_to_s3(content: str, s3_file_path: str, ingest_id: UUID) -> str:
 
     try:
         # Upload the content with ingest_id as tag
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_file_path,
-            Body=content.encode("utf-8"),
-            ContentType="text/plain",
-            Tagging=f"ingest_id={ingest_id!s}",
+        s3_client.upload_fileobj(
+            body,
+            bucket_name,
+            s3_file_path,
+            ExtraArgs={"ContentType": "text/plain", "Tagging": f"ingest_id={ingest_id!s}"},
+            Config=_digest_transfer_config(),
         )
     except ClientError as err:
         # Log upload failure
@@ -246,6 +299,8 @@ def upload_to_s3(content: str, s3_file_path: str, ingest_id: UUID) -> str:
 def upload_metadata_to_s3(metadata: S3Metadata, s3_file_path: str, ingest_id: UUID) -> str:
     """Upload metadata JSON to S3 alongside the digest file.
 
+    The JSON is stored gzip-compressed, with ``Content-Encoding: gzip``.
+
     Parameters
     ----------
     metadata : S3Metadata
@@ -279,11 +334,12 @@ def upload_metadata_to_s3(metadata: S3Metadata, s3_file_path: str, ingest_id: UU
     s3_client = create_s3_client()
     bucket_name = get_s3_bucket_name()
 
+    metadata_json = metadata.model_dump_json().encode("utf-8")
     extra_fields = {
         "bucket_name": bucket_name,
         "metadata_file_path": metadata_file_path,
         "ingest_id": str(ingest_id),
-        "metadata_size": len(metadata.model_dump_json()),
+        "metadata_size": len(metadata_json),
     }
 
     # Log upload attempt
@@ -294,8 +350,9 @@ def upload_metadata_to_s3(metadata: S3Metadata, s3_file_path: str, ingest_id: UU
         s3_client.put_object(
             Bucket=bucket_name,
             Key=metadata_file_path,
-            Body=metadata.model_dump_json(indent=2).encode("utf-8"),
+            Body=gzip.compress(metadata_json, compresslevel=_METADATA_COMPRESSLEVEL),
             ContentType="application/json",
+            ContentEncoding="gzip",
             Tagging=f"ingest_id={ingest_id!s}",
         )
     except ClientError as err:
@@ -368,7 +425,10 @@ def get_metadata_from_s3(s3_file_path: str) -> S3Metadata | None:
 
         # Get the metadata object
         response = s3_client.get_object(Bucket=bucket_name, Key=metadata_file_path)
-        metadata_content = response["Body"].read().decode("utf-8")
+        metadata_content = response["Body"].read()
+        # Metadata uploaded before compression was introduced is plain JSON
+        if response.get("ContentEncoding") == "gzip":
+            metadata_content = gzip.decompress(metadata_content)
 
         return S3Metadata.model_validate_json(metadata_content)
     except ClientError as err:
@@ -512,7 +572,7 @@ def get_s3_url_for_ingest_id(ingest_id: UUID) -> str | None:
 
         # List all objects in the ingest/ prefix and check their tags
         paginator = s3_client.get_paginator("list_objects_v2")
-        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix="ingest/")
+        page_iterator = paginator.paginate(Bucket=bucket_name, Prefix=_with_directory_prefix("ingest/"))
 
         objects_checked = 0
         for page in page_iterator:
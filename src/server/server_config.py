@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 from fastapi.templating import Jinja2Templates
@@ -22,6 +23,11 @@ EXAMPLE_REPOS: list[dict[str, str]] = [
 ]
 
 
+# When set, digest downloads are handed off to nginx through an ``X-Accel-Redirect`` to ``<prefix>/<id>/<file>``,
+# so the worker only returns headers; nginx must map the prefix as an ``internal`` location onto TMP_BASE_PATH
+DOWNLOAD_ACCEL_REDIRECT_PREFIX: str | None = os.getenv("GITINGEST_DOWNLOAD_ACCEL_REDIRECT_PREFIX") or None
+
+
 # Version and repository configuration
 APP_REPOSITORY = os.getenv("APP_REPOSITORY", "https://github.com/coderamp-labs/gitingest")
 APP_VERSION = os.getenv("APP_VERSION", "unknown")
@@ -51,6 +57,68 @@ def get_version_info() -> dict[str, str]:
     }
 
 
+@dataclass(frozen=True)
+class SentryConfig:
+    """Sentry settings read from the ``GITINGEST_SENTRY_*`` environment variables."""
+
+    dsn: str
+    traces_sample_rate: float
+    profile_session_sample_rate: float
+    profile_lifecycle: str
+    send_default_pii: bool
+    environment: str
+
+    @classmethod
+    def from_env(cls) -> SentryConfig | None:
+        """Read the Sentry configuration from the environment.
+
+        Returns
+        -------
+        SentryConfig | None
+            The configuration, or ``None`` if Sentry is not enabled or no DSN is provided.
+
+        """
+        dsn = os.getenv("GITINGEST_SENTRY_DSN")
+        if os.getenv("GITINGEST_SENTRY_ENABLED") is None or not dsn:
+            return None
+
+        profile_lifecycle = os.getenv("GITINGEST_SENTRY_PROFILE_LIFECYCLE", "trace")
+        return cls(
+            dsn=dsn,
+            traces_sample_rate=float(os.getenv("GITINGEST_SENTRY_TRACES_SAMPLE_RATE", "1.0")),
+            profile_session_sample_rate=float(os.getenv("GITINGEST_SENTRY_PROFILE_SESSION_SAMPLE_RATE", "1.0")),
+            profile_lifecycle=profile_lifecycle if profile_lifecycle in ("manual", "trace") else "trace",
+            send_default_pii=os.getenv("GITINGEST_SENTRY_SEND_DEFAULT_PII", "true").lower() == "true",
+            environment=os.getenv("GITINGEST_SENTRY_ENVIRONMENT", ""),
+        )
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """Prometheus metrics server settings read from the ``GITINGEST_METRICS_*`` environment variables."""
+
+    host: str
+    port: int
+
+    @classmethod
+    def from_env(cls) -> MetricsConfig | None:
+        """Read the metrics server configuration from the environment.
+
+        Returns
+        -------
+        MetricsConfig | None
+            The configuration, or ``None`` if the metrics server is not enabled.
+
+        """
+        if os.getenv("GITINGEST_METRICS_ENABLED") is None:
+            return None
+
+        return cls(
+            host=os.getenv("GITINGEST_METRICS_HOST", "127.0.0.1"),
+            port=int(os.getenv("GITINGEST_METRICS_PORT", "9090")),
+        )
+
+
 # Use absolute path to templates directory
 templates_dir = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=templates_dir)
@@ -1,13 +1,20 @@
 """Utility functions for the server."""
 
-from fastapi import Request
-from fastapi.responses import Response
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from fastapi.responses import HTMLResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from gitingest.utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from fastapi import Request
+
 # Initialize logger for this module
 logger = get_logger(__name__)
 
@@ -43,31 +50,84 @@ async def rate_limit_exception_handler(request: Request, exc: Exception) -> Resp
     raise exc
 
 
-## Color printing utility
-class Colors:
-    """ANSI color codes."""
-
-    BLACK = "\033[0;30m"
-    RED = "\033[0;31m"
-    GREEN = "\033[0;32m"
-    BROWN = "\033[0;33m"
-    BLUE = "\033[0;34m"
-    PURPLE = "\033[0;35m"
-    CYAN = "\033[0;36m"
-    LIGHT_GRAY = "\033[0;37m"
-    DARK_GRAY = "\033[1;30m"
-    LIGHT_RED = "\033[1;31m"
-    LIGHT_GREEN = "\033[1;32m"
-    YELLOW = "\033[1;33m"
-    LIGHT_BLUE = "\033[1;34m"
-    LIGHT_PURPLE = "\033[1;35m"
-    LIGHT_CYAN = "\033[1;36m"
-    WHITE = "\033[1;37m"
-    BOLD = "\033[1m"
-    FAINT = "\033[2m"
-    ITALIC = "\033[3m"
-    UNDERLINE = "\033[4m"
-    BLINK = "\033[5m"
-    NEGATIVE = "\033[7m"
-    CROSSED = "\033[9m"
-    END = "\033[0m"
+def canonical_page_url(request: Request) -> str:
+    """Return the URL of the requested page without its query string or fragment.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming HTTP request.
+
+    Returns
+    -------
+    str
+        The scheme, host and path of the requested URL.
+
+    """
+    return str(request.url.replace(query="", fragment=""))
+
+
+def encode_html_page(html: str) -> tuple[bytes, str]:
+    """Encode a rendered HTML page and compute its ETag.
+
+    Parameters
+    ----------
+    html : str
+        The rendered page.
+
+    Returns
+    -------
+    tuple[bytes, str]
+        The UTF-8 encoded page and its quoted ETag.
+
+    """
+    content = html.encode()
+    return content, f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag``.
+
+    The header is a comma-separated list of entity tags, or ``*``. Tags are compared weakly, as RFC 9110 requires for
+    ``If-None-Match``: a ``W/`` prefix is ignored, but the quoted tag must match as a whole.
+
+    Parameters
+    ----------
+    if_none_match : str | None
+        The value of the ``If-None-Match`` request header, if any.
+    etag : str
+        The quoted ETag of the current representation.
+
+    Returns
+    -------
+    bool
+        ``True`` if the client's copy is current.
+
+    """
+    if not if_none_match:
+        return False
+    matching = ("*", etag, f"W/{etag}")
+    return any(tag.strip() in matching for tag in if_none_match.split(","))
+
+
+def html_page_response(request: Request, page: tuple[bytes, str]) -> Response:
+    """Serve a pre-rendered HTML page, answering ``304 Not Modified`` when the client's copy is current.
+
+    Parameters
+    ----------
+    request : Request
+        The incoming HTTP request.
+    page : tuple[bytes, str]
+        The page content and ETag, as returned by ``encode_html_page``.
+
+    Returns
+    -------
+    Response
+        The page as ``text/html``, or an empty ``304`` response if ``If-None-Match`` matches the ETag.
+
+    """
+    content, etag = page
+    headers = {"ETag": etag}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(content=content, headers=headers)
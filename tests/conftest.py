@@ -16,6 +16,8 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from gitingest.query_parser import IngestionQuery
+from gitingest.utils.git_utils import _resolve_ref_to_sha
+from gitingest.utils.query_parser_utils import _check_repo_exists_cached, _parse_qualified_source
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -201,6 +203,14 @@ def stub_branches(mocker: MockerFixture) -> Callable[[list[str]], None]:
     return _factory
 
 
+@pytest.fixture(autouse=True)
+def _clear_query_parser_caches() -> None:
+    """Drop cached host probes, resolved refs and parsed sources so tests do not leak into each other."""
+    _resolve_ref_to_sha.cache_clear()  # type: ignore[attr-defined]
+    _check_repo_exists_cached.cache_clear()  # type: ignore[attr-defined]
+    _parse_qualified_source.cache_clear()
+
+
 @pytest.fixture
 def repo_exists_true(mocker: MockerFixture) -> AsyncMock:
     """Patch ``gitingest.clone.check_repo_exists`` to always return ``True``."""
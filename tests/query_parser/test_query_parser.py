@@ -13,12 +13,20 @@ from typing import TYPE_CHECKING, Callable
 import pytest
 
 from gitingest.query_parser import parse_local_dir_path, parse_remote_repo
-from gitingest.utils.query_parser_utils import _is_valid_git_commit_hash
-from tests.conftest import DEMO_URL
+from gitingest.utils.query_parser_utils import (
+    KNOWN_GIT_HOSTS,
+    _check_repo_exists_cached,
+    _is_valid_git_commit_hash,
+    _normalise_source,
+    _try_domains_for_user_and_repo,
+)
+from tests.conftest import DEMO_COMMIT, DEMO_URL
 
 if TYPE_CHECKING:
     from unittest.mock import AsyncMock
 
+    from pytest_mock import MockerFixture
+
     from gitingest.schemas import IngestionQuery
 
 
@@ -326,6 +334,115 @@ async def test_parse_repo_source_with_various_url_patterns(
     assert query.subpath == expected_subpath
 
 
+@pytest.mark.asyncio
+async def test_try_domains_prefers_known_host_order(mocker: MockerFixture) -> None:
+    """Test ``_try_domains_for_user_and_repo`` when the slug exists on several hosts.
+
+    Given a slug that exists on both gitlab.com and codeberg.org:
+    When ``_try_domains_for_user_and_repo`` is called,
+    Then every known host should be probed and the first match in ``KNOWN_GIT_HOSTS`` order returned.
+    """
+    existing = {"https://gitlab.com/user/repo", "https://codeberg.org/user/repo"}
+    check_mock = mocker.patch(
+        "gitingest.utils.query_parser_utils.check_repo_exists",
+        new_callable=mocker.AsyncMock,
+        side_effect=lambda url, **_: url in existing,
+    )
+
+    domain = await _try_domains_for_user_and_repo("user", "repo")
+
+    assert domain == "gitlab.com"
+    assert check_mock.await_count == len(KNOWN_GIT_HOSTS)
+
+
+@pytest.mark.asyncio
+async def test_try_domains_caches_probe_results(mocker: MockerFixture) -> None:
+    """Test that ``_try_domains_for_user_and_repo`` reuses recent positive ``check_repo_exists`` results.
+
+    Given a slug that was resolved moments ago:
+    When ``_try_domains_for_user_and_repo`` is called again,
+    Then the host it was found on should not be probed a second time, but the hosts it was not found on should.
+    """
+    check_mock = mocker.patch(
+        "gitingest.utils.query_parser_utils.check_repo_exists",
+        new_callable=mocker.AsyncMock,
+        side_effect=lambda url, **_: url == "https://gitlab.com/user/repo",
+    )
+
+    first = await _try_domains_for_user_and_repo("user", "repo")
+    second = await _try_domains_for_user_and_repo("user", "repo")
+
+    assert first == second == "gitlab.com"
+    probed = [call.args[0] for call in check_mock.await_args_list]
+    assert probed.count("https://gitlab.com/user/repo") == 1
+    assert probed.count("https://github.com/user/repo") == 2  # noqa: PLR2004 (negative results are not cached)
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_is_not_cached(mocker: MockerFixture) -> None:
+    """Test that a probe failing with an error is retried on the next call.
+
+    Given a repository whose first ``git ls-remote`` fails with a transient error:
+    When ``_check_repo_exists_cached`` is called twice,
+    Then the first call should report the repository as missing and the second one should find it.
+    """
+    resolve_mock = mocker.patch(
+        "gitingest.utils.git_utils._resolve_ref_to_sha",
+        new_callable=mocker.AsyncMock,
+        side_effect=[RuntimeError("Connection reset by peer"), DEMO_COMMIT],
+    )
+
+    first = await _check_repo_exists_cached(DEMO_URL)
+    second = await _check_repo_exists_cached(DEMO_URL)
+
+    assert not first
+    assert second is True
+    assert resolve_mock.await_count == 2  # noqa: PLR2004 (the failure was not cached)
+
+
+@pytest.mark.asyncio
+async def test_normalise_source_caches_qualified_urls(mocker: MockerFixture) -> None:
+    """Test that ``_normalise_source`` reuses the parsed result for a repeated URL.
+
+    Given a URL with a scheme and a host path without one, each normalised once already:
+    When ``_normalise_source`` is called again with the same inputs,
+    Then the cached results should be returned and no host should be probed.
+    """
+    domains_mock = mocker.patch(
+        "gitingest.utils.query_parser_utils._try_domains_for_user_and_repo",
+        new_callable=mocker.AsyncMock,
+    )
+
+    for raw in (DEMO_URL, "gitlab.com/user/repo"):
+        first = await _normalise_source(raw, token=None)
+        second = await _normalise_source(raw, token=None)
+        assert first is second
+
+    domains_mock.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_normalise_source_resolves_slugs_every_time(mocker: MockerFixture) -> None:
+    """Test that ``_normalise_source`` does not memoise the host a slug resolved to.
+
+    Given the slug "user/repo" normalised once already:
+    When ``_normalise_source`` is called again with the same input,
+    Then the host lookup should run again, relying on the probe cache instead.
+    """
+    domains_mock = mocker.patch(
+        "gitingest.utils.query_parser_utils._try_domains_for_user_and_repo",
+        new_callable=mocker.AsyncMock,
+        side_effect=["gitlab.com", "github.com"],
+    )
+
+    first = await _normalise_source("user/repo", token=None)
+    second = await _normalise_source("user/repo", token=None)
+
+    assert first.geturl() == "https://gitlab.com/user/repo"
+    assert second.geturl() == "https://github.com/user/repo"
+    assert domains_mock.await_count == 2  # noqa: PLR2004 (one lookup per call)
+
+
 @pytest.mark.asyncio
 async def _assert_basic_repo_fields(url: str, sha_mock: AsyncMock) -> IngestionQuery:
     """Run ``parse_remote_repo`` and assert user, repo and slug are parsed."""
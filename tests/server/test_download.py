@@ -0,0 +1,98 @@
+"""Tests for the local digest download endpoint."""
+
+from __future__ import annotations
+
+import uuid
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Generator
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from src.server.main import app
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture
+def client() -> Generator[TestClient, None, None]:
+    """Create a test client."""
+    with TestClient(app, base_url="http://localhost") as client_instance:
+        yield client_instance
+
+
+@pytest.fixture
+def digest_dir(mocker: MockerFixture, tmp_path: Path) -> Path:
+    """Serve digests from ``tmp_path`` instead of the shared temporary directory."""
+    mocker.patch("server.routers.ingest._TMP_BASE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_download_returns_digest(client: TestClient, digest_dir: Path) -> None:
+    """Test that the digest file of an ingest is sent as an attachment.
+
+    Given an ingest directory holding a ``.txt`` digest:
+    When downloading it,
+    Then the digest should be returned with its file name.
+    """
+    ingest_id = uuid.uuid4()
+    (digest_dir / str(ingest_id)).mkdir()
+    (digest_dir / str(ingest_id) / "octocat-hello-world.txt").write_text("Tree\nContent")
+
+    response = client.get(f"/api/download/file/{ingest_id}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text == "Tree\nContent"
+    assert "octocat-hello-world.txt" in response.headers["content-disposition"]
+
+
+def test_download_missing_directory_returns_404(client: TestClient, digest_dir: Path) -> None:
+    """Test that downloading an unknown ingest returns 404.
+
+    Given no directory for an ingest id:
+    When downloading it,
+    Then a 404 should be returned.
+    """
+    ingest_id = uuid.uuid4()
+    assert not (digest_dir / str(ingest_id)).exists()
+
+    response = client.get(f"/api/download/file/{ingest_id}")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in response.json()["detail"]
+
+
+def test_download_directory_without_txt_returns_404(client: TestClient, digest_dir: Path) -> None:
+    """Test that downloading an ingest without a ``.txt`` digest returns 404.
+
+    Given an ingest directory holding only a cloned repository and a non-``.txt`` file:
+    When downloading it,
+    Then a 404 should be returned.
+    """
+    ingest_id = uuid.uuid4()
+    (digest_dir / str(ingest_id) / "octocat-hello-world").mkdir(parents=True)
+    (digest_dir / str(ingest_id) / "notes.md").write_text("Not a digest")
+
+    response = client.get(f"/api/download/file/{ingest_id}")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "No .txt file found" in response.json()["detail"]
+
+
+@pytest.mark.usefixtures("digest_dir")
+@pytest.mark.parametrize("ingest_id", ["not-a-uuid", "digest.txt", "1234"])
+def test_download_rejects_non_uuid_id(client: TestClient, ingest_id: str) -> None:
+    """Test that an ingest id that is not a UUID is rejected before touching the file system.
+
+    Given an ingest id that is not a UUID:
+    When downloading it,
+    Then a 422 should be returned.
+    """
+    response = client.get(f"/api/download/file/{ingest_id}")
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["loc"] == ["path", "ingest_id"]
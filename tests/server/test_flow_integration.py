@@ -3,6 +3,7 @@
 import shutil
 import sys
 from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 from pathlib import Path
 from typing import Generator
 
@@ -91,6 +92,23 @@ async def test_invalid_repository_url(request: pytest.FixtureRequest) -> None:
     assert "error" in response_data
 
 
+@pytest.mark.asyncio
+async def test_blank_input_text(request: pytest.FixtureRequest) -> None:
+    """Test that a blank repository URL is rejected with a clear message."""
+    client = request.getfixturevalue("test_client")
+    form_data = {
+        "input_text": "   ",
+        "max_file_size": 243,
+        "pattern_type": "exclude",
+        "pattern": "",
+        "token": "",
+    }
+
+    response = client.post("/api/ingest", json=form_data)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY, f"Request failed: {response.text}"
+    assert "input_text cannot be empty" in response.text
+
+
 @pytest.mark.asyncio
 async def test_large_repository(request: pytest.FixtureRequest) -> None:
     """Simulate analysis of a large repository with nested folders."""
@@ -0,0 +1,74 @@
+"""Tests for the cached HTML and static text pages served by the ``index``, ``dynamic`` and ``main`` modules."""
+
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from server.routers.dynamic import _render_git_page
+from server.routers.index import _render_home
+from src.server.main import app
+
+
+@pytest.fixture
+def client() -> Generator[TestClient, None, None]:
+    """Create a test client with empty page caches."""
+    _render_home.cache_clear()
+    _render_git_page.cache_clear()
+    with TestClient(app, base_url="http://localhost") as client_instance:
+        yield client_instance
+
+
+def test_query_string_does_not_bypass_page_cache(client: TestClient) -> None:
+    """Test that pages differing only in their query string share one cache entry.
+
+    Given requests for the same pages with different query strings:
+    When they are served,
+    Then each page should be rendered once, with an ``og:url`` that has no query string.
+    """
+    for i in range(5):
+        assert client.get(f"/?x={i}").status_code == status.HTTP_200_OK
+        response = client.get(f"/octocat/Hello-World?x={i}")
+        assert response.status_code == status.HTTP_200_OK
+
+    assert _render_home.cache_info().currsize == 1
+    assert _render_git_page.cache_info().currsize == 1
+    assert 'content="http://localhost/octocat/Hello-World"' in response.text
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected_status"),
+    [
+        ("{etag}", status.HTTP_304_NOT_MODIFIED),
+        ("W/{etag}", status.HTTP_304_NOT_MODIFIED),
+        ('"other", {etag}', status.HTTP_304_NOT_MODIFIED),
+        ("*", status.HTTP_304_NOT_MODIFIED),
+        ('"other"', status.HTTP_200_OK),
+        ("{etag_prefix}", status.HTTP_200_OK),
+        ('"x{etag_body}x"', status.HTTP_200_OK),
+    ],
+)
+@pytest.mark.parametrize("path", ["/", "/octocat/Hello-World", "/robots.txt"])
+def test_if_none_match_compares_whole_etags(
+    client: TestClient,
+    path: str,
+    if_none_match: str,
+    expected_status: int,
+) -> None:
+    """Test that ``If-None-Match`` answers ``304`` only when one of its entity tags matches the page's ETag.
+
+    Given the ETag of a page:
+    When requesting the page again with an ``If-None-Match`` header,
+    Then a full list entry, its weak form or ``*`` should give ``304``,
+    And a different tag, or one merely containing or contained in the ETag, should give ``200``.
+    """
+    etag = client.get(path).headers["etag"]
+    header = if_none_match.format(etag=etag, etag_prefix=etag[:-3] + '"', etag_body=etag.strip('"'))
+
+    response = client.get(path, headers={"If-None-Match": header})
+
+    assert response.status_code == expected_status
+    assert response.headers["etag"] == etag
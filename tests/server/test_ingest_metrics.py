@@ -0,0 +1,31 @@
+"""Tests for the ``host`` label of the ingest request counter."""
+
+from __future__ import annotations
+
+import pytest
+
+from server.routers.ingest import _host_label
+
+
+@pytest.mark.parametrize(
+    ("input_text", "expected"),
+    [
+        ("https://github.com/octocat/Hello-World", "github.com"),
+        ("HTTPS://GitHub.com/octocat/Hello-World", "github.com"),
+        ("gitlab.com/user/repo", "gitlab.com"),
+        ("https://gist.github.com/octocat/abc123", "gist.github.com"),
+        ("octocat/Hello-World", "slug"),
+        ("octocat", "slug"),
+        ("https://git.example.com/user/repo", "other"),
+        ("example.org/user/repo", "other"),
+        ("http://[::1/user/repo", "other"),
+    ],
+)
+def test_host_label(input_text: str, expected: str) -> None:
+    """Test that ``_host_label`` keeps known hosts and folds everything else into ``slug`` or ``other``.
+
+    Given a repository URL, a bare host path, a slug, an unknown host, or an unparseable URL:
+    When computing its metric label,
+    Then known Git hosts should be reported by name, slugs as ``slug``, and anything else as ``other``.
+    """
+    assert _host_label(input_text) == expected
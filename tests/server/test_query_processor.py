@@ -0,0 +1,264 @@
+"""Tests for the ``query_processor`` module.
+
+These tests cover how ``process_query`` shares identical ingests, both while they run and once they are cached.
+Cloning and ingesting are mocked; digests are written to a temporary directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from gitingest.schemas import CloneConfig, IngestionQuery
+from server.models import IngestSuccessResponse, PatternType
+from server.query_processor import (
+    _in_flight_ingests,
+    _ingest_cache,
+    _ingest_cache_key,
+    _single_flight,
+    process_query,
+)
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from pytest_mock import MockerFixture
+
+REPO_URL = "https://github.com/octocat/Hello-World"
+COMMIT = "a" * 40
+MAX_FILE_SIZE_KB = 50
+
+
+@pytest.fixture(autouse=True)
+def _clear_ingest_state() -> None:
+    """Start every test with an empty ingest cache and no ingest in flight."""
+    _ingest_cache.clear()
+    _in_flight_ingests.clear()
+
+
+@pytest.fixture
+def clone_mock(mocker: MockerFixture, tmp_path: Path) -> AsyncMock:
+    """Mock parsing, cloning and ingesting, so that ``process_query`` only exercises its own logic.
+
+    Every parsed query gets a fresh id and local path under ``tmp_path``. The returned clone mock yields to the event
+    loop before creating the local path, like a real clone would.
+    """
+
+    async def _parse_remote_repo(input_text: str, token: str | None = None) -> IngestionQuery:  # noqa: ARG001 (mock)
+        ingest_id = uuid.uuid4()
+        return IngestionQuery(
+            host="github.com",
+            user_name="octocat",
+            repo_name="Hello-World",
+            url=REPO_URL,
+            local_path=tmp_path / str(ingest_id) / "octocat-hello-world",
+            slug="octocat-hello-world",
+            id=ingest_id,
+            commit=COMMIT,
+        )
+
+    async def _clone_repo(config: CloneConfig, token: str | None = None) -> None:  # noqa: ARG001 (mock)
+        await asyncio.sleep(0.01)
+        Path(config.local_path).mkdir(parents=True)
+
+    mocker.patch("server.query_processor.parse_remote_repo", side_effect=_parse_remote_repo)
+    mocker.patch("server.query_processor.ingest_query", return_value=("Summary", "Tree", "Content"))
+    return mocker.patch("server.query_processor.clone_repo", side_effect=_clone_repo)
+
+
+async def _process(input_text: str = REPO_URL, pattern: str = "") -> IngestSuccessResponse:
+    """Run ``process_query`` with default options and return its successful response."""
+    response = await process_query(
+        input_text=input_text,
+        max_file_size=MAX_FILE_SIZE_KB,
+        pattern_type=PatternType.EXCLUDE,
+        pattern=pattern,
+    )
+    assert isinstance(response, IngestSuccessResponse)
+    return response
+
+
+async def test_identical_concurrent_queries_share_one_ingest(clone_mock: AsyncMock) -> None:
+    """Test that identical queries running at the same time share a single clone and ingest.
+
+    Given two concurrent queries for the same repository and options, written differently:
+    When both are processed,
+    Then the repository should be cloned once,
+    And each response should report its own input,
+    And no ingest should be left in flight.
+    """
+    slug_response, url_response = await asyncio.gather(_process("octocat/Hello-World"), _process(REPO_URL))
+
+    clone_mock.assert_called_once()
+    assert slug_response.repo_url == "octocat/Hello-World"
+    assert url_response.repo_url == REPO_URL
+    assert slug_response.digest_url == url_response.digest_url
+    assert not _in_flight_ingests
+
+
+async def test_single_flight_failure_reaches_all_waiters() -> None:
+    """Test that the exception of a shared ingest is raised to every caller.
+
+    Given an ingest that fails after yielding to the event loop:
+    When two callers run it for the same key,
+    Then it should run once and both callers should get its exception,
+    And no ingest should be left in flight.
+    """
+    calls = 0
+
+    async def _ingest() -> IngestSuccessResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        msg = "clone failed"
+        raise RuntimeError(msg)
+
+    results = await asyncio.gather(
+        _single_flight("key", _ingest),
+        _single_flight("key", _ingest),
+        return_exceptions=True,
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) and str(result) == "clone failed" for result in results)
+    assert not _in_flight_ingests
+
+
+async def test_single_flight_waiter_cancellation_does_not_cancel_shared_ingest() -> None:
+    """Test that a waiting caller being cancelled leaves the shared ingest running.
+
+    Given an ingest started by one caller and joined by a second one:
+    When the second caller is cancelled,
+    Then the first caller should still get the ingest's response,
+    And no ingest should be left in flight.
+    """
+    release = asyncio.Event()
+
+    async def _ingest() -> str:
+        await release.wait()
+        return "digest"
+
+    leader = asyncio.create_task(_single_flight("key", _ingest))  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_single_flight("key", _ingest))  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    release.set()
+
+    assert await leader == "digest"
+    assert not _in_flight_ingests
+
+
+async def test_single_flight_cancelled_leader_hands_over_to_waiter() -> None:
+    """Test that a waiting caller runs the ingest itself if the caller running it is cancelled.
+
+    Given an ingest started by one caller and joined by a second one:
+    When the first caller is cancelled,
+    Then the second caller should run the ingest and get its response,
+    And no ingest should be left in flight.
+    """
+    calls = 0
+
+    async def _ingest() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "digest"
+
+    leader = asyncio.create_task(_single_flight("key", _ingest))  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_single_flight("key", _ingest))  # type: ignore[arg-type]
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    assert await waiter == "digest"
+    assert calls == 2  # noqa: PLR2004 (the waiter ran the ingest again)
+    assert not _in_flight_ingests
+
+
+async def test_repeated_query_is_served_from_the_ingest_cache(clone_mock: AsyncMock) -> None:
+    """Test that a query identical to a finished one is answered from the ingest cache.
+
+    Given a query that has been processed:
+    When the same query is processed again,
+    Then the repository should not be cloned again,
+    And the cached digest should be returned.
+    """
+    first = await _process()
+    second = await _process()
+
+    clone_mock.assert_called_once()
+    assert second == first
+
+
+async def test_cache_entry_with_deleted_digest_is_reingested(clone_mock: AsyncMock, tmp_path: Path) -> None:
+    """Test that a cached ingest whose digest file is gone is evicted and ingested again.
+
+    Given a processed query whose digest file has since been deleted:
+    When the same query is processed again,
+    Then the repository should be cloned again,
+    And the new response should point to a digest file that exists.
+    """
+    first = await _process()
+    ingest_id = first.digest_url.rsplit("/", 1)[-1]
+    (tmp_path / ingest_id / "octocat-hello-world.txt").unlink()
+
+    second = await _process()
+
+    assert clone_mock.call_count == 2  # noqa: PLR2004 (one clone per ingest)
+    assert second.digest_url != first.digest_url
+    assert (tmp_path / second.digest_url.rsplit("/", 1)[-1] / "octocat-hello-world.txt").is_file()
+
+
+@pytest.mark.parametrize(
+    ("changes", "token"),
+    [
+        ({"commit": "b" * 40}, None),
+        ({"include_patterns": {"*.py"}}, None),
+        ({"ignore_patterns": {"*.md"}}, None),
+        ({"max_file_size": 1024}, None),
+        ({"subpath": "/docs"}, None),
+        ({}, "github_pat_" + "x" * 22 + "_" + "y" * 59),
+    ],
+)
+def test_ingest_cache_key_covers_digest_inputs(changes: dict[str, object], token: str | None) -> None:
+    """Test that every input changing the digest also changes the ingest cache key.
+
+    Given a query and a copy of it differing in one option, or processed with a token:
+    When building their cache keys,
+    Then the keys should differ.
+    """
+    query = IngestionQuery(
+        url=REPO_URL,
+        local_path=Path("/tmp/octocat-hello-world"),
+        slug="octocat-hello-world",
+        id=uuid.uuid4(),
+        commit=COMMIT,
+    )
+    other = query.model_copy(update={"id": uuid.uuid4(), **changes})
+
+    assert _ingest_cache_key(other, token) != _ingest_cache_key(query, None)
+
+
+def test_ingest_cache_key_ignores_ingest_id() -> None:
+    """Test that two parses of the same query, with different ids and local paths, share one cache key."""
+    first = IngestionQuery(
+        url=REPO_URL,
+        local_path=Path("/tmp/first/octocat-hello-world"),
+        slug="octocat-hello-world",
+        id=uuid.uuid4(),
+        commit=COMMIT,
+    )
+    second = first.model_copy(update={"id": uuid.uuid4(), "local_path": Path("/tmp/second/octocat-hello-world")})
+
+    assert _ingest_cache_key(second, None) == _ingest_cache_key(first, None)
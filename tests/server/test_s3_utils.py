@@ -0,0 +1,40 @@
+"""Tests for the ``s3_utils`` module."""
+
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
+from server.s3_utils import get_s3_url_for_ingest_id
+
+if TYPE_CHECKING:
+    import pytest
+    from pytest_mock import MockerFixture
+
+
+def test_get_s3_url_for_ingest_id_scans_prefixed_digests(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the ingest ID lookup lists digests under ``S3_DIRECTORY_PREFIX``.
+
+    Given digests uploaded with ``S3_DIRECTORY_PREFIX`` set, one of them tagged with the ingest ID:
+    When looking up the ingest ID,
+    Then the prefixed ``ingest/`` directory should be listed and the URL of the tagged digest returned.
+    """
+    ingest_id = uuid.uuid4()
+    monkeypatch.setenv("S3_DIRECTORY_PREFIX", "digests/")
+    monkeypatch.setenv("S3_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("S3_ALIAS_HOST", "https://cdn.example.com")
+    mocker.patch("server.s3_utils.is_s3_enabled", return_value=True)
+    s3_client = mocker.patch("server.s3_utils.create_s3_client").return_value
+    paginate = s3_client.get_paginator.return_value.paginate
+    paginate.return_value = [{"Contents": [{"Key": "digests/ingest/a.txt"}, {"Key": "digests/ingest/b.txt"}]}]
+    s3_client.get_object_tagging.side_effect = lambda Bucket, Key: {  # noqa: ARG005, N803 (boto3 keyword names)
+        "TagSet": [{"Key": "ingest_id", "Value": str(ingest_id) if Key.endswith("b.txt") else "other"}],
+    }
+
+    url = get_s3_url_for_ingest_id(ingest_id)
+
+    paginate.assert_called_once_with(Bucket="bucket", Prefix="digests/ingest/")
+    assert url == "https://cdn.example.com/digests/ingest/b.txt"
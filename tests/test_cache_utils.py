@@ -0,0 +1,68 @@
+"""Tests for the ``cache_utils`` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from gitingest.utils.cache_utils import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used_entries_over_maxweight() -> None:
+    """Test that entries are evicted, least recently used first, once their total weight exceeds ``maxweight``.
+
+    Given a cache weighing values by their length:
+    When storing values whose total length exceeds ``maxweight``,
+    Then the least recently used entries should be evicted until the total fits again.
+    """
+    cache: TTLCache[str, str] = TTLCache(ttl=60, maxweight=10, weigh=len)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.get("a") == "aaaa"  # ``a`` is now the most recently used entry
+
+    cache.set("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.get("c") == "cccc"
+    assert cache.weight == len("aaaa") + len("cccc")
+
+
+def test_ttl_cache_skips_values_heavier_than_maxweight() -> None:
+    """Test that a value heavier than ``maxweight`` is not stored and does not evict anything.
+
+    Given a cache holding a light value:
+    When storing a value heavier than ``maxweight``,
+    Then the heavy value should not be stored and the light value should be kept.
+    """
+    cache: TTLCache[str, str] = TTLCache(ttl=60, maxweight=10, weigh=len)
+    cache.set("a", "aaaa")
+
+    cache.set("b", "b" * 11)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.weight == len("aaaa")
+
+
+def test_ttl_cache_pop_and_overwrite_release_weight() -> None:
+    """Test that removing or replacing an entry releases its weight.
+
+    Given a cache holding weighed values:
+    When an entry is replaced and another one is popped,
+    Then the total weight should only count the remaining values.
+    """
+    cache: TTLCache[str, str] = TTLCache(ttl=60, maxweight=10, weigh=len)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+
+    cache.set("a", "aa")
+    cache.pop("b")
+
+    assert len(cache) == 1
+    assert cache.weight == len("aa")
+
+
+def test_ttl_cache_maxweight_requires_weigh() -> None:
+    """Test that ``maxweight`` without a ``weigh`` function is rejected."""
+    with pytest.raises(ValueError, match="weigh"):
+        TTLCache(ttl=60, maxweight=10)
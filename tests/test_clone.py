@@ -6,12 +6,16 @@ and handling edge cases such as nonexistent URLs, timeouts, redirects, and speci
 
 from __future__ import annotations
 
+import asyncio
 import sys
+import threading
 from typing import TYPE_CHECKING
 
+import git
 import pytest
 
 from gitingest.clone import clone_repo
+from gitingest.config import DEFAULT_TIMEOUT
 from gitingest.schemas import CloneConfig
 from gitingest.utils.git_utils import check_repo_exists
 from tests.conftest import DEMO_URL, LOCAL_REPO_PATH
@@ -53,17 +57,16 @@ async def test_clone_with_commit(repo_exists_true: AsyncMock, gitpython_mocks: d
     # Verify GitPython calls were made
     mock_git_cmd = gitpython_mocks["git_cmd"]
     mock_repo = gitpython_mocks["repo"]
-    mock_clone_from = gitpython_mocks["clone_from"]
 
     # Should have called version (for ensure_git_installed)
     mock_git_cmd.version.assert_called()
 
-    # Should have called clone_from (since partial_clone=False)
-    mock_clone_from.assert_called_once()
+    # Should have cloned through the git command, so the clone can be killed on timeout
+    mock_git_cmd.clone.assert_called_once()
 
     # Should have called fetch and checkout on the repo
     mock_repo.git.fetch.assert_called()
-    mock_repo.git.checkout.assert_called_with(commit_hash)
+    assert mock_repo.git.checkout.call_args.args == (commit_hash,)
 
 
 @pytest.mark.asyncio
@@ -134,12 +137,11 @@ async def test_clone_without_commit(repo_exists_true: AsyncMock, gitpython_mocks
     # Verify GitPython calls were made
     mock_git_cmd = gitpython_mocks["git_cmd"]
     mock_repo = gitpython_mocks["repo"]
-    mock_clone_from = gitpython_mocks["clone_from"]
 
     # Should have resolved the commit via ls_remote
     mock_git_cmd.ls_remote.assert_called()
     # Should have cloned the repo
-    mock_clone_from.assert_called_once()
+    mock_git_cmd.clone.assert_called_once()
     # Should have fetched and checked out
     mock_repo.git.fetch.assert_called()
     mock_repo.git.checkout.assert_called()
@@ -162,8 +164,7 @@ async def test_clone_creates_parent_directory(tmp_path: Path, gitpython_mocks: d
     assert nested_path.parent.exists()
 
     # Verify clone operation happened
-    mock_clone_from = gitpython_mocks["clone_from"]
-    mock_clone_from.assert_called_once()
+    gitpython_mocks["git_cmd"].clone.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -202,7 +203,68 @@ async def test_clone_with_include_submodules(gitpython_mocks: dict) -> None:
 
     # Verify submodule update was called
     mock_repo = gitpython_mocks["repo"]
-    mock_repo.git.submodule.assert_called_with("update", "--init", "--recursive", "--depth=1")
+    assert mock_repo.git.submodule.call_args.args == ("update", "--init", "--recursive", "--depth=1")
+
+
+@pytest.mark.asyncio
+async def test_clone_failure_removes_local_path(tmp_path: Path, gitpython_mocks: dict) -> None:
+    """Test that a failed clone leaves nothing behind.
+
+    Given a ``git clone`` that writes to the local path and then fails:
+    When ``clone_repo`` is called,
+    Then a RuntimeError should be raised and the local path removed.
+    """
+    local_path = tmp_path / "repo"
+
+    def _failing_clone(*_args: object, **_kwargs: object) -> None:
+        local_path.mkdir()
+        raise git.GitCommandError(["git", "clone"], 128)
+
+    gitpython_mocks["git_cmd"].clone.side_effect = _failing_clone
+
+    with pytest.raises(RuntimeError, match="Git clone failed"):
+        await clone_repo(CloneConfig(url=DEMO_URL, local_path=str(local_path)))
+
+    assert not local_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_clone_is_removed_once_git_stops(tmp_path: Path, gitpython_mocks: dict) -> None:
+    """Test that a cancelled (e.g. timed out) clone is cleaned up after its git command stops.
+
+    Given a ``git clone`` that is still running when ``clone_repo`` is cancelled:
+    When the git command finishes,
+    Then the git command should have been given a kill timeout and the local path should be removed.
+    """
+    local_path = tmp_path / "repo"
+    started = threading.Event()
+    release = threading.Event()
+
+    def _slow_clone(*_args: object, **_kwargs: object) -> None:
+        local_path.mkdir()
+        started.set()
+        release.wait(timeout=5)
+
+    mock_clone = gitpython_mocks["git_cmd"].clone
+    mock_clone.side_effect = _slow_clone
+
+    task = asyncio.create_task(clone_repo(CloneConfig(url=DEMO_URL, local_path=str(local_path))))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The worker thread is still inside ``git clone``; its output must not be removed underneath it
+    assert local_path.exists()
+    if sys.platform != "win32":
+        assert 0 < mock_clone.call_args.kwargs["kill_after_timeout"] <= DEFAULT_TIMEOUT
+
+    release.set()
+    for _ in range(100):
+        if not local_path.exists():
+            break
+        await asyncio.sleep(0.01)
+    assert not local_path.exists()
 
 
 @pytest.mark.asyncio
@@ -12,10 +12,13 @@ from typing import TYPE_CHECKING, TypedDict
 import pytest
 
 from gitingest.ingestion import ingest_query
+from gitingest.utils.ingestion_utils import _compile_ignore_spec, _compile_include_spec
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
     from gitingest.query_parser import IngestionQuery
 
 
@@ -46,6 +49,33 @@ def test_run_ingest_query(temp_directory: Path, sample_query: IngestionQuery) ->
     assert "dir2/file_dir2.txt" in content
 
 
+def test_ingest_query_compiles_patterns_once(
+    temp_directory: Path,
+    sample_query: IngestionQuery,
+    mocker: MockerFixture,
+) -> None:
+    """Test that ``ingest_query`` compiles its patterns once for the whole directory walk.
+
+    Given a directory tree and a query with ignore and include patterns:
+    When ``ingest_query`` is invoked,
+    Then each pattern set should be compiled exactly once.
+    """
+    sample_query.local_path = temp_directory
+    sample_query.subpath = "/"
+    sample_query.type = None
+    sample_query.include_patterns = {"*.txt"}
+    compile_ignore = mocker.patch("gitingest.ingestion._compile_ignore_spec", wraps=_compile_ignore_spec)
+    compile_include = mocker.patch("gitingest.ingestion._compile_include_spec", wraps=_compile_include_spec)
+
+    summary, _, content = ingest_query(sample_query)
+
+    compile_ignore.assert_called_once_with(sample_query.ignore_patterns)
+    compile_include.assert_called_once_with({"*.txt"})
+    assert "src/subdir/file_subdir.txt" in content
+    assert "file2.py" not in content
+    assert "Files analyzed: 5" in summary
+
+
 # TODO: Additional tests:
 # - Multiple include patterns, e.g. ["*.txt", "*.py"] or ["/src/*", "*.txt"].
 # - Edge cases with weird file names or deep subdirectory structures.
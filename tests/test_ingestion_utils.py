@@ -6,7 +6,13 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from gitingest.utils.ingestion_utils import _should_include
+from gitingest.utils.ingestion_utils import (
+    _compile_ignore_spec,
+    _compile_include_spec,
+    _get_ignore_spec,
+    _should_exclude,
+    _should_include,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -23,7 +29,7 @@ def fixture_base_dir(tmp_path: Path) -> Path:
 
 def test_should_include_skips_unrelated_directories(base_dir: Path) -> None:
     """Directories with no relationship to the include patterns are skipped."""
-    include = {"src/**/*.py"}
+    include = _compile_include_spec({"src/**/*.py"})
 
     assert _should_include(base_dir / "src", base_dir, include)
     assert _should_include(base_dir / "src" / "nested", base_dir, include)
@@ -32,7 +38,7 @@ def test_should_include_skips_unrelated_directories(base_dir: Path) -> None:
 
 def test_should_include_only_allows_ancestors(base_dir: Path) -> None:
     """Only directories that are ancestors of an include pattern remain."""
-    include = {"tests/unit/test_example.py"}
+    include = _compile_include_spec({"tests/unit/test_example.py"})
 
     assert _should_include(base_dir / "tests", base_dir, include)
     assert _should_include(base_dir / "tests" / "unit", base_dir, include)
@@ -41,7 +47,7 @@ def test_should_include_only_allows_ancestors(base_dir: Path) -> None:
 
 def test_should_include_handles_global_patterns(base_dir: Path) -> None:
     """Recursive patterns keep directories in play for potential matches."""
-    include = {"**/*.py"}
+    include = _compile_include_spec({"**/*.py"})
 
     assert _should_include(base_dir / "docs", base_dir, include)
     assert _should_include(base_dir / "src" / "nested", base_dir, include)
@@ -49,4 +55,13 @@ def test_should_include_handles_global_patterns(base_dir: Path) -> None:
 
 def test_should_include_returns_false_when_no_patterns(base_dir: Path) -> None:
     """Without include patterns, directories should be skipped."""
-    assert not _should_include(base_dir / "docs", base_dir, set())
+    assert not _should_include(base_dir / "docs", base_dir, _compile_include_spec(set()))
+
+
+def test_should_exclude_reuses_compiled_spec(base_dir: Path) -> None:
+    """Equal ignore pattern sets share one compiled ``PathSpec``."""
+    _get_ignore_spec.cache_clear()
+
+    assert _should_exclude(base_dir / "docs", base_dir, _compile_ignore_spec({"docs", "*.md"}))
+    assert not _should_exclude(base_dir / "src", base_dir, _compile_ignore_spec({"*.md", "docs"}))
+    assert _get_ignore_spec.cache_info().misses == 1
@@ -30,6 +30,18 @@ def test_parse_patterns_valid() -> None:
     assert parsed_patterns == {"*.py", "*.md", "docs/*"}
 
 
+def test_parse_patterns_iterable_with_backslashes() -> None:
+    """Test ``_parse_patterns`` with an iterable of mixed-separator patterns.
+
+    Given Windows-style paths mixed with comma- and whitespace-separated patterns:
+    When ``_parse_patterns`` is called,
+    Then back-slashes should be normalised and empty tokens dropped.
+    """
+    parsed_patterns = _parse_patterns(["src\\*.py, docs/*", "  tests  *.md,,"])
+
+    assert parsed_patterns == {"src/*.py", "docs/*", "tests", "*.md"}
+
+
 def test_process_patterns_include_and_ignore_overlap() -> None:
     """Test ``process_patterns`` with overlapping patterns.
 